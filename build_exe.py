@@ -3,13 +3,25 @@
 Build script for Work Logger executable
 This script uses PyInstaller to create a standalone executable
 Works on Windows, macOS, and Linux
+
+PyInstaller's build/ work directory is kept between runs so unchanged
+modules are not re-analysed. Pass --clean for a full rebuild from scratch
+and --release for an optimized (-OO) build.
 """
 
+import argparse
 import subprocess
 import sys
 import os
 import shutil
 
+# Local cache for pip downloads, bytecode and PyInstaller's own cache
+CACHE_DIR = os.path.abspath(".cache")
+
+def cache_path(name):
+    """Get the absolute path of a subdirectory of the local build cache."""
+    return os.path.join(CACHE_DIR, name)
+
 def check_pyinstaller():
     """Check if PyInstaller is installed, install if not."""
     try:
@@ -19,23 +31,51 @@ def check_pyinstaller():
     except ImportError:
         print("PyInstaller is not installed. Installing now...")
         try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
+            subprocess.check_call([
+                sys.executable, "-m", "pip", "install",
+                "--cache-dir", cache_path("pip"), "pyinstaller"
+            ])
             print("✓ PyInstaller installed successfully")
             return True
         except subprocess.CalledProcessError:
             print("✗ Failed to install PyInstaller")
             return False
 
-def clean_build_dirs():
-    """Clean previous build directories."""
-    dirs_to_clean = ['build', 'dist']
+def clean_build_dirs(full=False):
+    """
+    Clean previous build output.
+    Only dist/ is removed unless full is True, in which case PyInstaller's
+    build/ cache is discarded as well.
+    """
+    dirs_to_clean = ['build', 'dist'] if full else ['dist']
     for dir_name in dirs_to_clean:
         if os.path.exists(dir_name):
             print(f"Cleaning {dir_name} directory...")
             shutil.rmtree(dir_name)
 
-def build_executable():
-    """Build the executable using PyInstaller."""
+def optimize_level_changed(level):
+    """
+    Record the optimization level used for this build.
+    Returns True if it differs from the level of the previous build, in which
+    case cached bytecode from that build must not be reused.
+    """
+    stamp_path = cache_path("optimize_level")
+    previous = None
+    if os.path.exists(stamp_path):
+        with open(stamp_path, 'r', encoding='utf-8') as f:
+            previous = f.read().strip()
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(stamp_path, 'w', encoding='utf-8') as f:
+        f.write(str(level))
+
+    return previous is not None and previous != str(level)
+
+def build_executable(full_clean=False, release=False):
+    """
+    Build the executable using PyInstaller.
+    Release builds are optimized with -OO, stripping docstrings and asserts.
+    """
     print("\n" + "="*50)
     print("Work Logger - Build Executable")
     print("="*50 + "\n")
@@ -44,13 +84,30 @@ def build_executable():
     if not check_pyinstaller():
         return False
 
-    # Clean previous builds
-    clean_build_dirs()
+    # Clean previous builds; bytecode cached at another optimization level
+    # would otherwise be picked up by PyInstaller
+    optimize_level = 2 if release else 0
+    if optimize_level_changed(optimize_level):
+        print("Optimization level changed since the last build.")
+        full_clean = True
+        if os.path.exists(cache_path("pycache")):
+            shutil.rmtree(cache_path("pycache"))
+    clean_build_dirs(full=full_clean)
+
+    # Keep compiled bytecode and PyInstaller's cache in a stable location
+    env = os.environ.copy()
+    env["PYTHONPYCACHEPREFIX"] = cache_path("pycache")
+    env["PYINSTALLER_CONFIG_DIR"] = cache_path("pyinstaller")
+
+    command = [sys.executable, "-m", "PyInstaller", "--noconfirm", "work_logger.spec"]
+    if release:
+        env["PYTHONOPTIMIZE"] = str(optimize_level)
+        command.insert(1, "-OO")
 
     # Build using spec file
-    print("\nBuilding executable...")
+    print("\nBuilding release executable..." if release else "\nBuilding executable...")
     try:
-        subprocess.check_call([sys.executable, "-m", "PyInstaller", "work_logger.spec"])
+        subprocess.check_call(command, env=env)
 
         print("\n" + "="*50)
         print("Build Complete!")
@@ -80,8 +137,28 @@ def build_executable():
         print(f"\n✗ Build failed with error: {e}")
         return False
 
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Build the Work Logger executable.")
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help="remove PyInstaller's build/ cache too and do a full rebuild "
+             "(by default build/ is kept so rebuilds are incremental)"
+    )
+    parser.add_argument(
+        "--release",
+        action="store_true",
+        help="optimized build (-OO): strips docstrings and asserts for a smaller, "
+             "faster-starting executable"
+    )
+    return parser.parse_args()
+
 if __name__ == "__main__":
-    success = build_executable()  # pylint: disable=invalid-name
+    args = parse_args()  # pylint: disable=invalid-name
+    success = build_executable(  # pylint: disable=invalid-name
+        full_clean=args.clean, release=args.release
+    )
 
     if not success:
         print("\nBuild failed. Please check the error messages above.")
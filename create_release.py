@@ -9,55 +9,123 @@ This script automates the entire release process:
 4. GitHub Actions automatically builds executables
 
 Usage:
-    python create_release.py
+    python create_release.py [--wait]
+
+    --wait  wait for the GitHub Actions build and report its cache usage
 
 Or make it executable and run:
     chmod +x create_release.py
     ./create_release.py
 """
 
+import argparse
+import os
 import subprocess
 import sys
 import re
-from pathlib import Path
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Don't allocate a console window for child processes on Windows
+_RUN_KW = {"creationflags": subprocess.CREATE_NO_WINDOW} if sys.platform == "win32" else {}
+
+# Resolved once as plain strings; they are passed straight to open() and git
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_WORK_LOGGER_PATH = os.path.join(_SCRIPT_DIR, "work_logger.py")
+
+# The lookups made while the user is typing must never prompt for anything
+# (they would fight input() for the terminal) and must not hang
+_PREFETCH_TIMEOUT = 30
+_NO_PROMPT_ENV = {
+    **os.environ,
+    'GIT_TERMINAL_PROMPT': '0',
+    'GIT_SSH_COMMAND': os.environ.get('GIT_SSH_COMMAND', 'ssh') + ' -o BatchMode=yes',
+    'GH_PROMPT_DISABLED': '1',
+}
+_PREFETCH_KW = {
+    'stdin': subprocess.DEVNULL, 'env': _NO_PROMPT_ENV, 'timeout': _PREFETCH_TIMEOUT, **_RUN_KW
+}
+
+# Polling of the release build for --wait, in seconds
+_RUN_FIND_TIMEOUT = 120
+_RUN_FINISH_TIMEOUT = 60 * 60
+_RUN_POLL_INTERVAL = 10
+
+# VERSION assignment in work_logger.py (capturing and replacing forms)
+_VERSION_RE = re.compile(r'VERSION\s*=\s*["\']([^"\']+)["\']')
+_VERSION_SUB_RE = re.compile(r'VERSION\s*=\s*["\'][^"\']+["\']')
+
+def read_notes_until_end(end_token='END'):
+    """Read multi-line notes from stdin until end_token or EOF."""
+    lines = []
+    while True:
+        try:
+            line = input()
+            # Check if user wants to finish
+            if line.strip().upper() == end_token:
+                break
+            lines.append(line)
+        except EOFError:
+            # Handle Ctrl+D on Unix or Ctrl+Z on Windows
+            break
+
+    return '\n'.join(lines).strip()
 
 
 class ReleaseAutomation:  # pylint: disable=too-few-public-methods
     """Handles automated release creation for Work Logger."""
 
-    def __init__(self):
-        self.repo_root = Path(__file__).parent
-        self.work_logger_path = self.repo_root / "work_logger.py"
+    GITHUB_REPO = "redjoy12/Work-Logger"
+
+    def __init__(self, wait_for_build=False):
+        self.wait_for_build = wait_for_build
+        self.repo_root = _SCRIPT_DIR
+        self.work_logger_path = _WORK_LOGGER_PATH
+        self._work_logger_src = self._read_work_logger()
         self.current_version = self._get_current_version()
+        self._behind_future = None
+        self._probe_future = None
 
-    def _get_current_version(self):
-        """Extract current version from work_logger.py."""
+    def _read_work_logger(self):
+        """Read work_logger.py once so the source can be reused."""
         try:
             with open(self.work_logger_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                match = re.search(r'VERSION\s*=\s*["\']([^"\']+)["\']', content)
-                if match:
-                    return match.group(1)
+                return f.read()
         except (FileNotFoundError, PermissionError, IOError) as e:
             print(f"Error reading current version: {e}")
         return None
 
+    def _get_current_version(self):
+        """Extract current version from work_logger.py."""
+        if self._work_logger_src is None:
+            return None
+        match = _VERSION_RE.search(self._work_logger_src)
+        if match:
+            return match.group(1)
+        return None
+
     def _update_version_in_file(self, new_version):
         """Update VERSION constant in work_logger.py."""
-        try:
-            with open(self.work_logger_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+        if self._work_logger_src is None:
+            print("✗ Error updating version: could not read work_logger.py")
+            return False
 
-            # Replace the VERSION line
-            updated_content = re.sub(
-                r'VERSION\s*=\s*["\'][^"\']+["\']',
-                f'VERSION = "{new_version}"',
-                content
-            )
+        # Replace the VERSION line
+        updated_content = _VERSION_SUB_RE.sub(
+            f'VERSION = "{new_version}"',
+            self._work_logger_src
+        )
 
+        if updated_content == self._work_logger_src:
+            print(f"✓ VERSION is already {new_version} in work_logger.py")
+            return True
+
+        try:
             with open(self.work_logger_path, 'w', encoding='utf-8') as f:
                 f.write(updated_content)
 
+            self._work_logger_src = updated_content
             print(f"✓ Updated VERSION to {new_version} in work_logger.py")
             return True
         except (FileNotFoundError, PermissionError, IOError) as e:
@@ -65,18 +133,24 @@ class ReleaseAutomation:  # pylint: disable=too-few-public-methods
             return False
 
     def _validate_version(self, version):
-        """Validate version format (e.g., 1.0.0)."""
-        pattern = r'^\d+\.\d+\.\d+$'
-        return re.match(pattern, version) is not None
+        """Validate version format (e.g., 1.0.0), rejecting leading zeros like 1.01.0."""
+        parts = version.split('.')
+        return len(parts) == 3 and all(
+            part.isascii() and part.isdigit() and not (len(part) > 1 and part[0] == '0')
+            for part in parts
+        )
 
     def _check_git_status(self):
         """Check if working directory is clean."""
         try:
+            # The untracked cache lets git reuse directory stat data from the
+            # index instead of rescanning every directory for untracked files
             result = subprocess.run(
-                ['git', 'status', '--porcelain'],
+                ['git', '-c', 'core.untrackedCache=true', 'status', '--porcelain'],
                 capture_output=True,
                 text=True,
-                check=True
+                check=True,
+                **_RUN_KW
             )
             return result.stdout.strip() == ""
         except subprocess.CalledProcessError:
@@ -89,7 +163,8 @@ class ReleaseAutomation:  # pylint: disable=too-few-public-methods
                 ['gh', '--version'],
                 capture_output=True,
                 text=True,
-                check=True
+                check=True,
+                **_RUN_KW
             )
             print(f"✓ GitHub CLI found: {result.stdout.split()[2]}")
             return True
@@ -101,6 +176,67 @@ class ReleaseAutomation:  # pylint: disable=too-few-public-methods
             print("  Linux:   See https://github.com/cli/cli/blob/trunk/docs/install_linux.md")
             return False
 
+    def _probe_github(self, tag):
+        """
+        Check gh authentication and whether a tag exists, in one GraphQL query.
+        Returns: (is_authenticated, tag_exists)
+        """
+        owner, name = self.GITHUB_REPO.split('/')
+        query = (
+            'query($owner:String!,$name:String!,$ref:String!){'
+            'viewer{login} repository(owner:$owner,name:$name){ref(qualifiedName:$ref){name}}}'
+        )
+        try:
+            result = subprocess.run(
+                ['gh', 'api', 'graphql', '-f', f'query={query}',
+                 '-f', f'owner={owner}', '-f', f'name={name}', '-f', f'ref=refs/tags/{tag}',
+                 '--jq', '.data.repository.ref != null'],
+                capture_output=True,
+                text=True,
+                check=False,
+                **_PREFETCH_KW
+            )
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return False, False
+        if result.returncode != 0:
+            return False, False
+        return True, result.stdout.strip() == 'true'
+
+    def _fetch_existing_tags(self):
+        """Get the tags of the most recent GitHub releases."""
+        try:
+            result = subprocess.run(
+                ['gh', 'release', 'list', '--repo', self.GITHUB_REPO, '--limit', '50',
+                 '--json', 'tagName', '--jq', '.[].tagName'],
+                capture_output=True,
+                text=True,
+                check=False,
+                **_PREFETCH_KW
+            )
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return set()
+        return set(result.stdout.split()) if result.returncode == 0 else set()
+
+    def _count_commits_behind(self):
+        """Count commits on origin/main that are not in the local branch."""
+        try:
+            subprocess.run(
+                ['git', 'fetch', '--quiet', 'origin', 'main'],
+                capture_output=True,
+                check=False,
+                **_PREFETCH_KW
+            )
+            result = subprocess.run(
+                ['git', 'rev-list', '--count', 'HEAD..origin/main'],
+                capture_output=True,
+                text=True,
+                check=False,
+                **_RUN_KW
+            )
+            return int(result.stdout.strip())
+        except (FileNotFoundError, ValueError, subprocess.TimeoutExpired):
+            return 0
+
     def _get_user_input(self):
         """Get version and release notes from user."""
         print("=" * 60)
@@ -115,31 +251,40 @@ class ReleaseAutomation:  # pylint: disable=too-few-public-methods
 
         print()
 
-        # Get new version
-        while True:
-            new_version = input("Enter new version number (e.g., 1.1.0): ").strip()
-            if self._validate_version(new_version):
-                break
-            print("Invalid version format. Use MAJOR.MINOR.PATCH (e.g., 1.1.0)")
-
-        # Get release notes
-        print("\nEnter release notes (you can use markdown formatting):")
-        print("Type 'END' on a new line when finished, or leave empty for default")
-        print("-" * 60)
+        # Look up existing releases and the state of origin/main while the user
+        # is typing; the results are only needed once the input is complete
+        executor = ThreadPoolExecutor(max_workers=2)
+        tags_future = executor.submit(self._fetch_existing_tags)
+        self._behind_future = executor.submit(self._count_commits_behind)
 
-        release_notes = []
-        while True:
-            try:
-                line = input()
-                # Check if user wants to finish
-                if line.strip().upper() == 'END':
+        try:
+            # Get new version
+            while True:
+                new_version = input("Enter new version number (e.g., 1.1.0): ").strip()
+                if not self._validate_version(new_version):
+                    print("Invalid version format. Use MAJOR.MINOR.PATCH (e.g., 1.1.0)")
+                elif f"v{new_version}" in tags_future.result():
+                    print(f"Release v{new_version} already exists. Choose a different version.")
+                else:
                     break
-                release_notes.append(line)
-            except EOFError:
-                # Handle Ctrl+D on Unix or Ctrl+Z on Windows
-                break
 
-        release_notes = '\n'.join(release_notes).strip()
+            # Check gh authentication and the new tag while the notes are typed;
+            # the release list above comes back empty when gh can't reach GitHub,
+            # so this is what catches a broken or unauthenticated gh
+            self._probe_future = executor.submit(self._probe_github, f"v{new_version}")
+            executor.shutdown(wait=False)
+
+            # Get release notes
+            print("\nEnter release notes (you can use markdown formatting):")
+            print("Type 'END' on a new line when finished, or leave empty for default")
+            print("-" * 60)
+
+            release_notes = read_notes_until_end()
+        except KeyboardInterrupt:
+            # Drop the lookups not started yet; the running ones end within
+            # _PREFETCH_TIMEOUT, so exiting can't wait on them indefinitely
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
 
         if not release_notes:
             print("\nNo release notes provided. Using default.")
@@ -150,33 +295,28 @@ class ReleaseAutomation:  # pylint: disable=too-few-public-methods
     def _commit_and_push(self, version):
         """Commit version change and push to GitHub."""
         try:
-            # Stage the modified file
-            subprocess.run(['git', 'add', str(self.work_logger_path)], check=True)
-
-            # Check if there are changes to commit
+            # Stage and commit just work_logger.py in one step; git reports an
+            # empty commit itself, so there is no need to probe the index first
+            commit_message = f"Bump version to {version}"
             result = subprocess.run(
-                ['git', 'diff', '--cached', '--quiet'],
-                capture_output=True,
-                check=False
+                ['git', 'commit', '-m', commit_message, '--only', self.work_logger_path],
+                capture_output=True, text=True, check=False, **_RUN_KW
             )
 
-            if result.returncode == 0:
-                # No changes staged
-                print(f"✗ No changes to commit. Version may already be {version}")
-                return False
+            if result.returncode != 0:
+                if 'nothing to commit' in result.stdout + result.stderr:
+                    print(f"✗ No changes to commit. Version may already be {version}")
+                    return False
+                raise subprocess.CalledProcessError(
+                    result.returncode, result.args, result.stdout, result.stderr
+                )
 
-            # Commit
-            commit_message = f"Bump version to {version}"
-            subprocess.run(
-                ['git', 'commit', '-m', commit_message],
-                check=True, capture_output=True, text=True
-            )
             print("✓ Committed version change")
 
             # Push to main
             subprocess.run(
-                ['git', 'push', 'origin', 'main'],
-                check=True, capture_output=True, text=True
+                ['git', '-c', 'push.autoSetupRemote=true', 'push', 'origin', 'main'],
+                check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, **_RUN_KW
             )
             print("✓ Pushed to origin/main")
 
@@ -189,21 +329,34 @@ class ReleaseAutomation:  # pylint: disable=too-few-public-methods
 
     def _create_github_release(self, version, release_notes):
         """Create GitHub release using gh CLI."""
-        try:
-            tag = f"v{version}"
+        tag = f"v{version}"
+        title = f"Work Logger v{version}"
 
-            # Create release
+        # Hand the notes to gh through a file; long notes can exceed the
+        # command line length limit on Windows and need no shell quoting this way
+        with tempfile.NamedTemporaryFile(suffix='.md', delete=False) as notes_file:
+            notes_file.write(release_notes.encode('utf-8'))
+            notes_path = notes_file.name
+
+        try:
+            # Create release (and its tag) with a single REST call
             cmd = [
-                'gh', 'release', 'create', tag,
-                '--title', f"Work Logger v{version}",
-                '--notes', release_notes
+                'gh', 'api', f'repos/{self.GITHUB_REPO}/releases',
+                '-f', f'tag_name={tag}',
+                '-f', f'name={title}',
+                '-F', f'body=@{notes_path}',
+                '--jq', '.html_url'
             ]
 
-            subprocess.run(cmd, check=True, capture_output=True, text=True)
+            # The output is captured and echoed: without a console of its own
+            # (_RUN_KW on Windows) gh can't write to the terminal directly
+            result = subprocess.run(cmd, check=True, capture_output=True, text=True, **_RUN_KW)
+            print(result.stdout.strip())
             print(f"✓ Created GitHub release: {tag}")
             print()
             print("GitHub Actions is now building executables...")
-            print("This will take about 5-10 minutes.")
+            print("This will take about 5-10 minutes (less when the pip and")
+            print("PyInstaller caches from the previous release are restored).")
             print()
             print("You can monitor progress at:")
             print("https://github.com/redjoy12/Work-Logger/actions")
@@ -224,15 +377,112 @@ class ReleaseAutomation:  # pylint: disable=too-few-public-methods
             print("  2. No permission to create releases in this repository")
             print("  3. Tag might already exist - check: gh release list")
             return False
+        finally:
+            os.unlink(notes_path)
+
+    def _find_build_run(self, commit_sha):
+        """
+        Find the build workflow run the release started, by its commit, polling
+        until GitHub has queued it.
+        Returns: (str) run id, or None if none appeared in _RUN_FIND_TIMEOUT
+        """
+        deadline = time.monotonic() + _RUN_FIND_TIMEOUT
+        while True:
+            result = subprocess.run(
+                ['gh', 'run', 'list', '--repo', self.GITHUB_REPO,
+                 '--workflow', 'build-and-release.yml', '--event', 'release',
+                 '--commit', commit_sha, '--limit', '1',
+                 '--json', 'databaseId', '--jq', '.[0].databaseId // empty'],
+                capture_output=True, text=True, check=False, **_RUN_KW
+            )
+            run_id = result.stdout.strip()
+            if result.returncode == 0 and run_id:
+                return run_id
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(_RUN_POLL_INTERVAL)
+
+    def _wait_for_run_completion(self, run_id):
+        """
+        Poll a workflow run until it finishes.
+        Returns: (str) the run's conclusion, or None if it didn't finish in time
+        """
+        deadline = time.monotonic() + _RUN_FINISH_TIMEOUT
+        while True:
+            result = subprocess.run(
+                ['gh', 'run', 'view', run_id, '--repo', self.GITHUB_REPO,
+                 '--json', 'status,conclusion', '--jq', '.status + " " + .conclusion'],
+                capture_output=True, text=True, check=False, **_RUN_KW
+            )
+            status, _, conclusion = result.stdout.strip().partition(' ')
+            if result.returncode == 0 and status == 'completed':
+                return conclusion
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(_RUN_POLL_INTERVAL)
+
+    def _report_cache_usage(self, run_id):
+        """Print, per job, how many of the run's caches were restored or missed."""
+        log = subprocess.run(
+            ['gh', 'run', 'view', run_id, '--repo', self.GITHUB_REPO, '--log'],
+            capture_output=True, text=True, check=False, **_RUN_KW
+        ).stdout
+
+        # Each log line is "<job>\t<step>\t<timestamp> <message>"
+        jobs = {}
+        for line in log.splitlines():
+            job, _, message = line.partition('\t')
+            if 'Cache restored from key' in message:
+                jobs.setdefault(job, [0, 0])[0] += 1
+            elif 'Cache not found for input keys' in message:
+                jobs.setdefault(job, [0, 0])[1] += 1
+
+        if not jobs:
+            print("\nBuild caches: no cache steps found in the run log")
+            return
+        print("\nBuild caches:")
+        for job, (hits, misses) in sorted(jobs.items()):
+            verdict = "hit" if not misses else "miss"
+            print(f"  {job}: {verdict} ({hits} restored, {misses} missed)")
+
+    def _wait_for_build_run(self):
+        """Wait for the release build and report whether its caches were hit."""
+        print("\nWaiting for the GitHub Actions build to finish...")
+        # The release was created from the commit that was just pushed
+        commit_sha = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            capture_output=True, text=True, check=False, **_RUN_KW
+        ).stdout.strip()
+        run_id = self._find_build_run(commit_sha) if commit_sha else None
+        if run_id is None:
+            print("✗ Could not find the build workflow run for this release")
+            return False
+
+        conclusion = self._wait_for_run_completion(run_id)
+        if conclusion is None:
+            print(f"✗ Build workflow run {run_id} did not finish in time")
+            return False
+
+        self._report_cache_usage(run_id)
+
+        if conclusion != 'success':
+            print(f"✗ Build workflow finished with: {conclusion}")
+            return False
+        print("✓ Build workflow completed")
+        return True
 
-    def create_release(self):  # pylint: disable=too-many-return-statements
+    def create_release(self):  # pylint: disable=too-many-return-statements,too-many-statements
         """Main function to orchestrate the release process."""
-        # Check prerequisites
-        if not self._check_gh_cli():
+        # Check prerequisites (gh CLI and clean working directory) concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            gh_future = executor.submit(self._check_gh_cli)
+            git_future = executor.submit(self._check_git_status)
+            gh_ok, git_clean = gh_future.result(), git_future.result()
+
+        if not gh_ok:
             return False
 
-        # Check if working directory is clean
-        if not self._check_git_status():
+        if not git_clean:
             print("\n✗ Working directory has uncommitted changes.")
             print("Please commit or stash changes before creating a release.")
             return False
@@ -255,6 +505,21 @@ class ReleaseAutomation:  # pylint: disable=too-few-public-methods
         print(f"Release notes: {release_notes[:100]}{'...' if len(release_notes) > 100 else ''}")
         print("=" * 60)
 
+        behind = self._behind_future.result()
+        if behind:
+            print(f"\nWarning: local branch is {behind} commit(s) behind origin/main.")
+            print("The push will be rejected until you pull those changes.")
+
+        # Started in _get_user_input; awaited before anything is changed,
+        # committed or pushed
+        gh_authenticated, tag_exists = self._probe_future.result()
+        if not gh_authenticated:
+            print("\n✗ GitHub CLI (gh) could not query GitHub - check: gh auth status")
+            return False
+        if tag_exists:
+            print(f"\n✗ Tag v{new_version} already exists - check: gh release list")
+            return False
+
         confirm = input("\nProceed with release? (yes/no): ").strip().lower()
         if confirm not in ['yes', 'y']:
             print("Release cancelled.")
@@ -269,7 +534,7 @@ class ReleaseAutomation:  # pylint: disable=too-few-public-methods
         # Step 2: Commit and push
         if not self._commit_and_push(new_version):
             print("\nRolling back version change...")
-            subprocess.run(['git', 'restore', str(self.work_logger_path)], check=False)
+            subprocess.run(['git', 'restore', self.work_logger_path], check=False, **_RUN_KW)
             return False
 
         # Step 3: Create GitHub release
@@ -278,6 +543,10 @@ class ReleaseAutomation:  # pylint: disable=too-few-public-methods
             print("You can create the release manually on GitHub.")
             return False
 
+        # Step 4 (optional): Wait for the executables to be built
+        if self.wait_for_build and not self._wait_for_build_run():
+            return False
+
         print("\n" + "=" * 60)
         print("✓ Release process completed successfully!")
         print("=" * 60)
@@ -286,7 +555,15 @@ class ReleaseAutomation:  # pylint: disable=too-few-public-methods
 
 def main():
     """Entry point for the release automation script."""
-    automation = ReleaseAutomation()
+    parser = argparse.ArgumentParser(description="Create a Work Logger release.")
+    parser.add_argument(
+        "--wait",
+        action="store_true",
+        help="wait for the GitHub Actions build and report its cache usage"
+    )
+    args = parser.parse_args()
+
+    automation = ReleaseAutomation(wait_for_build=args.wait)
 
     try:
         success = automation.create_release()
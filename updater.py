@@ -4,40 +4,390 @@ Handles checking for updates and downloading new versions from GitHub
 """
 
 import os
+import re
+import gzip
+import hashlib
 import sys
 import json
 import subprocess
 import platform
-from urllib import request
-from urllib.error import URLError
+import shutil
+import time
+import threading
+import http.client
+from concurrent.futures import Future
+from contextlib import contextmanager
+from functools import lru_cache
+from queue import Queue
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
 import tempfile
 
 
+_SYSTEM = platform.system()
+
+# Release asset names holding each platform's binary
+_ASSET_PATTERNS = {
+    'Windows': re.compile(r'\.exe$', re.IGNORECASE),
+    'Darwin': re.compile(r'macos|darwin', re.IGNORECASE),
+    'Linux': re.compile(r'^(?!.*\.exe$).*linux', re.IGNORECASE),
+}
+
+# e.g. "1.2.3", "v1.2.3", "1.2.3-beta.1", "1.2.3rc1"
+_VERSION_RE = re.compile(r'v?(\d+(?:\.\d+)*)(?:[-_.]?([a-z]+)[-_.]?(\d*))?', re.IGNORECASE)
+# Pre-release labels in ascending order; a final release sorts after all of them
+_PRERELEASE_RANK = {'dev': 0, 'a': 1, 'alpha': 1, 'b': 2, 'beta': 2, 'c': 3, 'rc': 3, 'pre': 3}
+
+
+@lru_cache(maxsize=64)
+def _parse_version(version):
+    """
+    Parse a version string into a comparable key.
+    Returns: (tuple) or None if the version isn't recognised
+    """
+    match = _VERSION_RE.fullmatch(version.strip())
+    if not match:
+        return None
+    release = [int(part) for part in match.group(1).split('.')]
+    while len(release) > 1 and release[-1] == 0:
+        release.pop()  # 1.2 == 1.2.0
+
+    label = match.group(2)
+    if label is None:
+        return tuple(release), (1,)
+    rank = _PRERELEASE_RANK.get(label.lower())
+    if rank is None:
+        return None
+    return tuple(release), (0, rank, int(match.group(3) or 0))
+
+
+# Top-level "tag_name" of a release document; quotes inside strings are escaped
+_TAG_NAME_RE = re.compile(rb'"tag_name"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# Runs update checks off the UI thread on a single daemon worker, so checks
+# never overlap and one still in flight can't keep the process alive on exit
+_TASKS = Queue()  # (Future, function, args) for _worker_loop to run
+_WORKER_LOCK = threading.Lock()
+_WORKER = {'thread': None}
+
+
+def _worker_loop():
+    """Run queued calls one at a time, resolving each one's Future."""
+    while True:
+        future, function, args = _TASKS.get()
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            result = function(*args)
+        except BaseException as e:  # pylint: disable=broad-exception-caught
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+
+def _submit(function, *args):
+    """
+    Run function(*args) on the updater's worker thread, started on first use.
+    Returns: (Future resolving to the call's result)
+    """
+    with _WORKER_LOCK:
+        if _WORKER['thread'] is None:
+            _WORKER['thread'] = threading.Thread(
+                target=_worker_loop, name='updater', daemon=True
+            )
+            _WORKER['thread'].start()
+    future = Future()
+    _TASKS.put((future, function, args))
+    return future
+
+# Process-wide check state: the in-flight check plus the last successful result,
+# reused for MIN_CHECK_INTERVAL seconds whichever Updater instance asks
+_CHECK_LOCK = threading.Lock()
+_CHECK_STATE = {'future': None, 'version': None, 'result': None, 'time': 0.0}
+MIN_CHECK_INTERVAL = 60
+
+# Keep-alive connections shared by all update requests, keyed by (scheme, host)
+_CONNECTIONS = {}
+_CONNECTIONS_LOCK = threading.Lock()
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+_RETRY_CODES = (502, 503, 504)
+_MAX_RETRIES = 3
+_RETRY_BACKOFF = 0.3
+
+
+def _get_connection(scheme, host, timeout):
+    """Take an idle pooled connection for host, or open a new one."""
+    with _CONNECTIONS_LOCK:
+        idle = _CONNECTIONS.get((scheme, host))
+        if idle:
+            conn = idle.pop()
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn
+    if scheme == 'https':
+        return http.client.HTTPSConnection(host, timeout=timeout)
+    return http.client.HTTPConnection(host, timeout=timeout)
+
+
+def _release_connection(scheme, host, conn, response):
+    """Return conn to the pool if its response was fully read and it can be reused."""
+    if response.isclosed() and not response.will_close:
+        with _CONNECTIONS_LOCK:
+            _CONNECTIONS.setdefault((scheme, host), []).append(conn)
+    else:
+        conn.close()
+
+
+def _send(url, method, headers, timeout):
+    """Send one request over a pooled connection, retrying transient failures."""
+    parts = urlsplit(url)
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+
+    for attempt in range(_MAX_RETRIES + 1):
+        conn = _get_connection(parts.scheme, parts.netloc, timeout)
+        try:
+            conn.request(method, path, headers=headers)
+            response = conn.getresponse()
+        except (OSError, http.client.HTTPException) as e:
+            # Includes a pooled keep-alive socket the server has since closed
+            conn.close()
+            if attempt == _MAX_RETRIES:
+                raise URLError(e) from e
+        else:
+            if response.status not in _RETRY_CODES or attempt == _MAX_RETRIES:
+                return parts, conn, response
+            response.read()
+            _release_connection(parts.scheme, parts.netloc, conn, response)
+        time.sleep(_RETRY_BACKOFF * (2 ** attempt))
+    raise URLError(f"Request to {url} failed")  # not reached
+
+
+@contextmanager
+def _open_url(url, headers=None, method='GET', timeout=10):
+    """
+    Open url over a reused keep-alive connection, following redirects.
+    Raises HTTPError for error (and 304) status codes like urllib.request.
+    Returns: (context manager yielding the http.client.HTTPResponse)
+    """
+    headers = dict(headers or {})
+    headers.setdefault('User-Agent', 'Work-Logger-Updater')
+
+    for _ in range(5):
+        parts, conn, response = _send(url, method, headers, timeout)
+        if response.status not in _REDIRECT_CODES:
+            break
+        location = response.getheader('Location')
+        response.read()
+        _release_connection(parts.scheme, parts.netloc, conn, response)
+        if not location:
+            raise URLError(f"Redirect without Location from {url}")
+        url = urljoin(url, location)
+    else:
+        raise URLError(f"Too many redirects for {url}")
+
+    try:
+        if response.status >= 300:
+            response.read()  # drain the (small) error body so the connection can be reused
+            raise HTTPError(url, response.status, response.reason, response.headers, None)
+        yield response
+    finally:
+        _release_connection(parts.scheme, parts.netloc, conn, response)
+
+
 class Updater:
     """Handles application updates from GitHub releases."""
 
     GITHUB_REPO = "redjoy12/Work-Logger"
     GITHUB_API_URL = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
 
+    # Release metadata from the last check, revalidated with conditional requests
+    CACHE_DIR = os.path.join(os.path.expanduser('~'), '.worklogger')
+    CACHE_FILE = os.path.join(CACHE_DIR, 'update_cache.json')
+    # Release notes are kept apart and only read when they are displayed
+    NOTES_FILE = os.path.join(CACHE_DIR, 'update_notes.md')
+    # Within this window a cached "no update" answer is reused without any request
+    CHECK_TTL_SECONDS = 6 * 3600
+    # Read the download in large chunks and batch writes to disk
+    DOWNLOAD_CHUNK_SIZE = 256 * 1024
+    WRITE_BUFFER_SIZE = 1024 * 1024
+    SMALL_DOWNLOAD_SIZE = 8 * 1024 * 1024  # below this, read in one call and progress reported once
+
     def __init__(self, current_version):
         self.current_version = current_version
         self.is_frozen = getattr(sys, 'frozen', False)  # True if running as .exe
+        self._cache = self._load_cache()
+        self._release_notes = None
+
+    def _load_cache(self):
+        """Load cached release metadata from the previous update check."""
+        try:
+            with open(self.CACHE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _write_cache_file(self, path, text):
+        """Write a cache file atomically; failures only cost a re-download."""
+        try:
+            os.makedirs(self.CACHE_DIR, exist_ok=True)
+            temp_path = path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(temp_path, path)
+        except OSError:
+            pass
+
+    def _save_cache(self, cache):
+        """Persist release metadata."""
+        self._cache = cache
+        self._write_cache_file(self.CACHE_FILE, json.dumps(cache))
+
+    def get_release_notes(self):
+        """Get the notes of the latest release, loading them from disk on first use."""
+        if self._release_notes is None:
+            try:
+                with open(self.NOTES_FILE, 'r', encoding='utf-8') as f:
+                    self._release_notes = f.read()
+            except OSError:
+                self._release_notes = 'No release notes available.'
+        return self._release_notes
+
+    def _fetch_release(self):
+        """
+        Fetch the latest release metadata from GitHub.
+        Sends the cached ETag/Last-Modified so an unchanged release costs a
+        bodyless 304 (which also doesn't count against the API rate limit).
+        """
+        headers = {
+            'Accept': 'application/vnd.github.v3+json',
+            'Accept-Encoding': 'gzip'  # release notes and asset lists compress well
+        }
+        cached = self._cache.get('payload')
+        # A tag-only payload can't answer once that tag counts as an update
+        if cached and ('assets' in cached or not self._is_newer_version(
+                cached.get('tag_name', '').lstrip('v'), self.current_version)):
+            if self._cache.get('etag'):
+                headers['If-None-Match'] = self._cache['etag']
+            if self._cache.get('last_modified'):
+                headers['If-Modified-Since'] = self._cache['last_modified']
+
+        try:
+            with _open_url(self.GITHUB_API_URL, headers) as response:
+                body = response.read()
+                if response.getheader('Content-Encoding') == 'gzip':
+                    body = gzip.decompress(body)
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+        except HTTPError as e:
+            if e.code != 304 or not self._cache.get('payload'):
+                raise
+            # Not modified - reuse the cached release
+            self._save_cache(dict(self._cache, fetched_at=time.time()))
+            return self._cache['payload']
+
+        payload = self._extract_release(body)
+        if 'body' in payload:
+            # Notes go to their own file, written before the metadata refers to them
+            self._release_notes = payload.pop('body')
+            self._write_cache_file(self.NOTES_FILE, self._release_notes)
+        self._save_cache({
+            'etag': etag,
+            'last_modified': last_modified,
+            'payload': payload,
+            'fetched_at': time.time()
+        })
+        return payload
+
+    def _extract_release(self, body):
+        """
+        Keep only the fields of the release JSON needed to answer a check.
+        When tag_name shows no update, the rest of the document (release notes,
+        asset list) is never parsed.
+        Returns: (dict with tag_name, plus body and assets for a newer release)
+        """
+        match = _TAG_NAME_RE.search(body)
+        if match:
+            tag_name = json.loads(b'"' + match.group(1) + b'"')
+            if not self._is_newer_version(tag_name.lstrip('v'), self.current_version):
+                return {'tag_name': tag_name}
+
+        data = json.loads(body.decode('utf-8'))
+        return {
+            'tag_name': data.get('tag_name', ''),
+            'body': data.get('body', 'No release notes available.'),
+            'assets': [
+                {'name': asset['name'], 'browser_download_url': asset['browser_download_url']}
+                for asset in data.get('assets', [])
+            ]
+        }
+
+    def _cache_is_fresh(self):
+        """
+        Check whether the cached release can answer without any request.
+        Only a cached "no update" younger than CHECK_TTL_SECONDS qualifies.
+        """
+        try:
+            age = time.time() - os.stat(self.CACHE_FILE).st_mtime
+        except OSError:
+            return False
+        if age >= self.CHECK_TTL_SECONDS:
+            return False
+
+        latest = self._cache.get('payload', {}).get('tag_name', '').lstrip('v')
+        return bool(latest) and not self._is_newer_version(latest, self.current_version)
 
-    def check_for_updates(self):
+    def check_for_updates(self, force=False):
         """
         Check if a new version is available on GitHub.
+        Pass force=True to skip the cache TTL and always ask GitHub; a result
+        from the last MIN_CHECK_INTERVAL seconds is still reused.
         Returns: (is_available, latest_version, download_url, release_notes)
+        release_notes is only loaded (and returned) when an update is available.
         """
-        try:
-            # Fetch latest release info from GitHub
-            req = request.Request(self.GITHUB_API_URL)
-            req.add_header('Accept', 'application/vnd.github.v3+json')
+        return self.check_for_updates_async(force).result()
 
-            with request.urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode('utf-8'))
+    def check_for_updates_async(self, force=False):
+        """
+        Run the update check on the updater's background thread.
+        Concurrent calls share one in-flight check, and a successful result is
+        reused for MIN_CHECK_INTERVAL seconds, across all Updater instances.
+        Returns: (Future resolving to the check_for_updates tuple)
+        """
+        with _CHECK_LOCK:
+            if (_CHECK_STATE['version'] == self.current_version
+                    and time.monotonic() - _CHECK_STATE['time'] < MIN_CHECK_INTERVAL):
+                future = Future()
+                future.set_result(_CHECK_STATE['result'])
+                return future
+
+            if _CHECK_STATE['future'] is None or _CHECK_STATE['future'].done():
+                future = _submit(self._check_for_updates, force)
+                future.add_done_callback(self._record_check)
+                _CHECK_STATE['future'] = future
+            return _CHECK_STATE['future']
+
+    def _record_check(self, future):
+        """Remember a successful check so repeated checks don't hit the network."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        with _CHECK_LOCK:
+            _CHECK_STATE.update(
+                version=self.current_version, result=future.result(), time=time.monotonic()
+            )
+
+    def _check_for_updates(self, force):
+        """Perform the update check (see check_for_updates)."""
+        try:
+            if not force and self._cache_is_fresh():
+                data = self._cache['payload']
+            else:
+                # Fetch latest release info from GitHub (or the cache if unchanged)
+                data = self._fetch_release()
 
             latest_version = data.get('tag_name', '').lstrip('v')
-            release_notes = data.get('body', 'No release notes available.')
 
             if not latest_version:
                 return False, None, None, None
@@ -46,25 +396,26 @@ class Updater:
             is_newer = self._is_newer_version(latest_version, self.current_version)
 
             if not is_newer:
-                return False, latest_version, None, release_notes
+                return False, latest_version, None, None
 
             # Find appropriate download URL based on platform and execution mode
             download_url = self._get_download_url(data.get('assets', []))
 
-            return True, latest_version, download_url, release_notes
+            return True, latest_version, download_url, self.get_release_notes()
 
-        except (URLError, json.JSONDecodeError, KeyError) as e:
+        except (URLError, OSError, EOFError, json.JSONDecodeError, KeyError) as e:
             raise RuntimeError(f"Failed to check for updates: {str(e)}") from e
 
     def _is_newer_version(self, latest, current):
-        """Compare version strings (e.g., '1.2.3' vs '1.2.2')."""
-        def version_tuple(v):
-            return tuple(map(int, v.split('.')))
-
+        """Compare version strings (e.g., '1.2.3' vs '1.2.2', '1.3.0-beta' vs '1.2.3')."""
         try:
-            return version_tuple(latest) > version_tuple(current)
-        except (ValueError, AttributeError):
+            latest_key = _parse_version(latest)
+            current_key = _parse_version(current)
+        except AttributeError:
             return False
+        if latest_key is None or current_key is None:
+            return False
+        return latest_key > current_key
 
     def _get_download_url(self, assets):
         """
@@ -73,55 +424,161 @@ class Updater:
         Returns None if no suitable download is found for the platform.
         This allows the caller to try alternative update methods (e.g., git update).
         """
-        system = platform.system()
+        pattern = _ASSET_PATTERNS.get(_SYSTEM)
 
-        if self.is_frozen:
+        if self.is_frozen and pattern:
             # Running as executable - look for platform-specific binary
-            if system == "Windows":
-                # Look for .exe file
-                for asset in assets:
-                    if asset['name'].endswith('.exe'):
-                        return asset['browser_download_url']
-            elif system == "Darwin":
-                # Look for macOS binary
-                for asset in assets:
-                    if 'macos' in asset['name'].lower() or 'darwin' in asset['name'].lower():
-                        return asset['browser_download_url']
-            elif system == "Linux":
-                # Look for Linux binary
-                for asset in assets:
-                    if 'linux' in asset['name'].lower() and not asset['name'].endswith('.exe'):
-                        return asset['browser_download_url']
+            for asset in assets:
+                if pattern.search(asset['name']):
+                    return asset['browser_download_url']
 
         # For Python script mode, source archives aren't useful for auto-update
         # Return None to allow git-based updates
         return None
 
-    def download_update(self, download_url, progress_callback=None):
+    def download_update(self, download_url, progress_callback=None, chunk_size=None,  # pylint: disable=too-many-arguments,too-many-positional-arguments
+                        cancel_event=None):
         """
-        Download the update file.
-        Returns: path to downloaded file
+        Download the update file, streamed to disk chunk_size bytes at a time
+        (DOWNLOAD_CHUNK_SIZE by default); files under SMALL_DOWNLOAD_SIZE are
+        read in one go.
+        Bytes are collected in a .part file; if the connection drops, the
+        download resumes from where it stopped with a Range request. Setting
+        cancel_event stops it after the current chunk (the .part file is kept,
+        and only resumed while the server still reports the same ETag).
+        Returns: path to downloaded file, or None if cancelled
         """
         try:
-            # Create temp file
             suffix = '.exe' if download_url.endswith('.exe') else '.zip'
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
-                temp_path = temp_file.name
-
-            # Download with progress
-            def report_progress(block_num, block_size, total_size):
-                if progress_callback and total_size > 0:
-                    downloaded = block_num * block_size
-                    percent = min(100, int((downloaded / total_size) * 100))
-                    progress_callback(percent)
-
-            request.urlretrieve(download_url, temp_path, reporthook=report_progress)
-
+            url_hash = hashlib.sha1(download_url.encode('utf-8')).hexdigest()[:12]
+            temp_path = os.path.join(
+                self._download_dir(), f'worklogger-update-{url_hash}{suffix}'
+            )
+            part_path = temp_path + '.part'
+            meta_path = part_path + '.meta'
+
+            # Preflight for the size and the validator needed to resume safely
+            with _open_url(download_url, method='HEAD', timeout=30) as response:
+                response.read()
+                total_size = int(response.getheader('Content-Length') or 0)
+                etag = response.getheader('ETag')
+
+            for attempt in range(_MAX_RETRIES + 1):
+                try:
+                    self._download_part(
+                        download_url, part_path, (total_size, etag), progress_callback,
+                        chunk_size or self.DOWNLOAD_CHUNK_SIZE, cancel_event
+                    )
+                    break
+                except HTTPError:
+                    raise
+                except (URLError, OSError, http.client.HTTPException):
+                    if attempt == _MAX_RETRIES or (cancel_event and cancel_event.is_set()):
+                        raise
+                    time.sleep(_RETRY_BACKOFF * (2 ** attempt))
+
+            if cancel_event and cancel_event.is_set():
+                return None
+            os.replace(part_path, temp_path)
+            try:
+                os.remove(meta_path)
+            except OSError:
+                pass
             return temp_path
 
-        except (URLError, IOError, OSError) as e:
+        except (URLError, IOError, OSError, http.client.HTTPException) as e:
             raise RuntimeError(f"Failed to download update: {str(e)}") from e
 
+    def _download_dir(self):
+        """
+        Get the directory to download updates into.
+        For executables this is the exe's own directory when writable, so the
+        installer can swap files with a rename instead of a cross-volume copy.
+        """
+        if self.is_frozen:
+            exe_dir = os.path.dirname(sys.executable)
+            if os.access(exe_dir, os.W_OK):
+                return exe_dir
+        return tempfile.gettempdir()
+
+    @staticmethod
+    def _resume_offset(part_path, total_size, etag):
+        """
+        Get how many bytes of part_path can be kept. They are only trusted
+        when the ETag and size stored next to them (in part_path + '.meta')
+        match what the server reports now; anything else starts over.
+        Returns: (int) byte offset to resume from, 0 to download everything
+        """
+        if not etag:
+            return 0
+        try:
+            with open(part_path + '.meta', 'rb') as f:
+                meta = json.loads(f.read())
+            offset = os.path.getsize(part_path)
+        except (OSError, ValueError):
+            return 0
+        if not isinstance(meta, dict) or meta.get('etag') != etag or meta.get('size') != total_size:
+            return 0
+        # A complete-looking .part is fetched again rather than trusted as is
+        if total_size and offset >= total_size:
+            return 0
+        return offset
+
+    def _download_part(self, download_url, part_path, expected,  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+                       progress_callback, chunk_size, cancel_event):
+        """
+        Download into part_path, continuing after the bytes already in it.
+        expected is the (size, ETag) pair from the preflight HEAD; resuming
+        requires the ETag the bytes were downloaded under to equal it, so
+        bytes of a changed file are never mixed in.
+        """
+        total_size, etag = expected
+        offset = self._resume_offset(part_path, total_size, etag)
+
+        headers = {}
+        if offset:
+            # If-Range: the server sends the whole file instead if it changed
+            headers['Range'] = f'bytes={offset}-'
+            headers['If-Range'] = etag
+
+        with _open_url(download_url, headers, timeout=30) as response:
+            if response.status != 206:
+                offset = 0
+            downloaded = offset
+            last_percent = -1
+            with open(part_path, 'ab' if offset else 'wb',
+                      buffering=self.WRITE_BUFFER_SIZE) as f:
+                if not offset:
+                    # The .part was just truncated; record which version of
+                    # the file it now holds
+                    with open(part_path + '.meta', 'wb') as meta:
+                        meta.write(json.dumps({'etag': etag, 'size': total_size}).encode('utf-8'))
+                if 0 < total_size < self.SMALL_DOWNLOAD_SIZE:
+                    # Small enough to fetch in one read, and too small for a
+                    # progress meter to be worth it: only 100% is reported
+                    data = response.read()
+                    if cancel_event and cancel_event.is_set():
+                        return
+                    f.write(data)
+                    downloaded += len(data)
+                    if progress_callback is not None:
+                        progress_callback(100)
+                else:
+                    while chunk := response.read(chunk_size):
+                        if cancel_event and cancel_event.is_set():
+                            return
+                        f.write(chunk)
+                        downloaded += len(chunk)
+                        if progress_callback is not None and total_size > 0:
+                            # Only report whole-percent changes, not every chunk
+                            percent = min(100, downloaded * 100 // total_size)
+                            if percent != last_percent:
+                                last_percent = percent
+                                progress_callback(percent)
+
+        if total_size and downloaded != total_size:
+            raise OSError(f"Download incomplete: {downloaded} of {total_size} bytes")
+
     def install_update(self, downloaded_file):
         """
         Install the downloaded update.
@@ -134,15 +591,34 @@ class Updater:
         # Running as Python script - use git
         return self._install_git_update()
 
+    def _stage_next_to(self, new_exe_path, current_exe):
+        """
+        Move a download from another directory (e.g. the temp dir) next to the
+        current executable, so the post-exit script only has to rename it.
+        shutil.copyfile copies in the kernel (sendfile/copy_file_range) where available.
+        Returns: path of the file the script should move into place
+        """
+        if os.path.dirname(new_exe_path) == os.path.dirname(current_exe):
+            return new_exe_path
+
+        staged_path = current_exe + '.new'
+        try:
+            shutil.copyfile(new_exe_path, staged_path)
+        except OSError:
+            # Leave the cross-directory move to the script
+            return new_exe_path
+        os.remove(new_exe_path)
+        return staged_path
+
     def _install_exe_update(self, new_exe_path):
         """
         Replace current executable with new one.
         Creates a batch/shell script to replace the file after exit.
         """
         current_exe = sys.executable
-        system = platform.system()
+        new_exe_path = self._stage_next_to(new_exe_path, current_exe)
 
-        if system == "Windows":
+        if _SYSTEM == "Windows":
             # Create batch script to replace exe and restart
             with tempfile.NamedTemporaryFile(delete=False, suffix='.bat') as script_file:
                 script_path = script_file.name
@@ -150,8 +626,7 @@ class Updater:
             script_content = f'''@echo off
 echo Updating Work Logger...
 timeout /t 2 /nobreak > nul
-copy /y "{new_exe_path}" "{current_exe}"
-del "{new_exe_path}"
+move /y "{new_exe_path}" "{current_exe}"
 echo Update complete! Restarting...
 start "" "{current_exe}"
 del "%~f0"
@@ -173,9 +648,8 @@ del "%~f0"
 
         script_content = f'''#!/bin/bash
 sleep 2
-cp "{new_exe_path}" "{current_exe}"
+mv -f "{new_exe_path}" "{current_exe}"
 chmod +x "{current_exe}"
-rm "{new_exe_path}"
 "{current_exe}" &
 rm "$0"
 '''
@@ -192,26 +666,29 @@ rm "$0"
 
     def _install_git_update(self):
         """Use git pull to update the application (for Python script mode)."""
-        try:
-            # Check if we're in a git repository
-            result = subprocess.run(
-                ['git', 'rev-parse', '--git-dir'],
-                capture_output=True, text=True, check=False
-            )
+        repo_dir = os.path.dirname(os.path.abspath(__file__))
 
-            if result.returncode != 0:
-                raise RuntimeError(
-                    "Not in a git repository. Please download manually from GitHub."
-                )
+        # Cheap check instead of spawning `git rev-parse` (.git is a file in worktrees)
+        if not os.path.exists(os.path.join(repo_dir, '.git')):
+            raise RuntimeError(
+                "Not in a git repository. Please download manually from GitHub."
+            )
 
-            # Fetch and pull latest changes
-            subprocess.run(['git', 'fetch', 'origin'], check=True, capture_output=True)
-            subprocess.run(['git', 'pull', 'origin', 'main'], check=True, capture_output=True)
+        try:
+            # pull fetches itself; --ff-only never creates a merge commit
+            subprocess.run(
+                ['git', '-C', repo_dir, 'pull', '--ff-only', '--quiet', 'origin', 'main'],
+                check=True,
+                capture_output=True,
+                timeout=60
+            )
 
             return True
 
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Git update failed: {str(e)}") from e
+        except subprocess.TimeoutExpired as e:
+            raise RuntimeError("Git update timed out. Please try again later.") from e
         except FileNotFoundError as exc:
             raise RuntimeError(
                 "Git is not installed. Please install git or download manually from GitHub."
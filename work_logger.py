@@ -7,39 +7,144 @@ A desktop app that reminds you every hour to document what you've been working o
 
 import tkinter as tk  # pylint: disable=import-error
 from tkinter import ttk, messagebox, scrolledtext  # pylint: disable=import-error
+import hashlib
+import importlib.util
 import json
 import os
 import sys
 import platform
 from datetime import datetime
-from threading import Thread, Event
+from operator import attrgetter
+from queue import Queue
+from threading import Event, Thread
 import time
-import subprocess
 
 # Version information
 VERSION = "1.0.5"
 
-# Import updater module
-try:
-    from updater import Updater
-    UPDATER_AVAILABLE = True
-except ImportError:
-    UPDATER_AVAILABLE = False
 
+# Compact JSON for saved tasks; much faster to produce than indented output
+JSON_SEPARATORS = (',', ':')
 
-class Task:
+# json.dumps builds a new encoder on every call with non-default options;
+# this one is built once and reused for every task
+JSON_ENCODER = json.JSONEncoder(separators=JSON_SEPARATORS)
+
+
+def format_display_time(dt):
+    """Format a datetime for display, e.g. '2024-01-31 09:00' (faster than strftime)."""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+
+
+# The updater module (and the HTTP stack it pulls in) is only imported when
+# an update check is started, keeping it out of the startup path
+UPDATER_AVAILABLE = importlib.util.find_spec('updater') is not None
+
+
+class Task:  # pylint: disable=too-many-instance-attributes
     """Represents a work task with start time, description, and completion status."""
 
+    # No per-instance __dict__; start_time/end_time are properties over _start_time/_end_time
+    __slots__ = (
+        'description', 'completed', '_json',
+        '_start_time', '_start_dt', '_start_date', '_start_display',
+        '_end_time', '_end_dt', '_end_display', '_duration_display'
+    )
+
+    # Fields written by to_dict; assigning any of them drops the cached JSON
+    SAVED_FIELDS = frozenset(('description', 'start_time', 'end_time', 'completed'))
+
     def __init__(self, description, start_time=None, end_time=None, completed=False):
+        self._json = None
         self.description = description
-        self.start_time = start_time or datetime.now().isoformat()
+        if start_time:
+            self.start_time = start_time
+        else:
+            now = self._now()
+            self.start_time = now.isoformat()
+            self._start_dt = now
         self.end_time = end_time
         self.completed = completed
 
+    @staticmethod
+    def _now():
+        """Get the current time to whole seconds; nothing finer is ever shown."""
+        return datetime.now().replace(microsecond=0)
+
+    def __setattr__(self, name, value):
+        if name in self.SAVED_FIELDS:
+            object.__setattr__(self, '_json', None)
+        object.__setattr__(self, name, value)
+
+    # start_time/end_time stay ISO strings (what is saved and edited); the
+    # parsed datetimes and display strings are cached and reset whenever a
+    # new string is assigned
+    @property
+    def start_time(self):
+        """Start time as an ISO format string."""
+        return self._start_time
+
+    @start_time.setter
+    def start_time(self, value):
+        self._start_time = value
+        self._start_dt = None
+        self._start_date = None
+        self._start_display = None
+        self._duration_display = None
+
+    @property
+    def end_time(self):
+        """End time as an ISO format string, or None while in progress."""
+        return self._end_time
+
+    @end_time.setter
+    def end_time(self, value):
+        self._end_time = value
+        self._end_dt = None
+        self._end_display = None
+        self._duration_display = None
+
+    @property
+    def start_dt(self):
+        """Start time as a datetime, parsed once."""
+        if self._start_dt is None:
+            self._start_dt = datetime.fromisoformat(self._start_time)
+        return self._start_dt
+
+    @property
+    def end_dt(self):
+        """End time as a datetime (parsed once), or None while in progress."""
+        if self._end_dt is None and self._end_time:
+            self._end_dt = datetime.fromisoformat(self._end_time)
+        return self._end_dt
+
+    @property
+    def start_date(self):
+        """Day the task started, e.g. '2024-01-31' (the name of its log file)."""
+        if self._start_date is None:
+            self._start_date = self.start_dt.date().isoformat()
+        return self._start_date
+
+    @property
+    def start_display(self):
+        """Start time formatted for display, e.g. '2024-01-31 09:00'."""
+        if self._start_display is None:
+            self._start_display = format_display_time(self.start_dt)
+        return self._start_display
+
+    @property
+    def end_display(self):
+        """End time formatted for display, or None while in progress."""
+        if self._end_display is None and self._end_time:
+            self._end_display = format_display_time(self.end_dt)
+        return self._end_display
+
     def complete(self):
         """Mark task as completed and record end time."""
+        now = self._now()
         self.completed = True
-        self.end_time = datetime.now().isoformat()
+        self.end_time = now.isoformat()
+        self._end_dt = now
 
     def to_dict(self):
         """Convert task to dictionary for JSON serialization."""
@@ -50,6 +155,12 @@ class Task:
             'completed': self.completed
         }
 
+    def to_json(self):
+        """Get the task as compact JSON, serialized again only after a change."""
+        if self._json is None:
+            self._json = JSON_ENCODER.encode(self.to_dict())
+        return self._json
+
     @classmethod
     def from_dict(cls, data):
         """Create task from dictionary."""
@@ -64,13 +175,16 @@ class Task:
         """Get human-readable duration string."""
         if not self.end_time:
             return "In progress"
+        if self._duration_display is None:
+            self._duration_display = self._format_duration()
+        return self._duration_display
 
-        start = datetime.fromisoformat(self.start_time)
-        end = datetime.fromisoformat(self.end_time)
-        duration = end - start
-
-        hours = duration.seconds // 3600
-        minutes = (duration.seconds % 3600) // 60
+    def _format_duration(self):
+        """Format the time between start and end, e.g. '1h 5m'."""
+        # total_seconds() includes whole days, which .seconds leaves out
+        total_seconds = max(0, int((self.end_dt - self.start_dt).total_seconds()))
+        hours, remainder = divmod(total_seconds, 3600)
+        minutes = remainder // 60
 
         if hours > 0:
             return f"{hours}h {minutes}m"
@@ -81,6 +195,11 @@ class WorkLogger:  # pylint: disable=too-many-instance-attributes
     """Main application class for Work Logger."""
 
     LOGS_DIR = 'logs'
+    CURRENT_TASK_FILE = os.path.join(LOGS_DIR, 'current_task.json')
+    SAVE_DELAY_MS = 200  # coalesce saves requested in quick succession
+    START_DELAY_MS = 100  # coalesce repeated Enter presses in the task entry
+    PROGRESS_INTERVAL = 0.1  # seconds between download progress updates
+    HISTORY_WINDOW = 100  # most recent tasks rendered in the history (per "show more")
 
     def __init__(self, root):
         self.root = root
@@ -121,22 +240,41 @@ class WorkLogger:  # pylint: disable=too-many-instance-attributes
         self.root.configure(bg=self.colors['bg'])
 
         self.tasks = []
+        self.tasks_by_date = {}  # 'YYYY-MM-DD' -> that day's tasks, by start time
+        self._loaded_dates = set()  # days whose log file has been read
         self.current_task = None
-        self.task_line_map = {}
+        self.task_tags = {}  # history text tag -> index in self.tasks of the task shown
+        self.history_first_index = 0  # oldest task rendered in the history
+        self.history_size = self.HISTORY_WINDOW  # how many recent tasks are rendered
+        self._history_dirty = False  # history changed while the window was minimized
         self.reminder_interval = 60 * 60  # 60 minutes in seconds (configurable)
-        self.reminder_thread = None
-        self.stop_reminder = Event()
+        self._reminder_after_id = None
+        self._save_after_id = None
+        self._dirty_dates = set()  # days whose log file needs rewriting
+        self._written_digests = {}  # log file path -> digest of what was last written
+        self._day_file_paths = {}  # date string -> path of that day's log file
+        self._write_queue = Queue()  # (path, bytes) for _writer_loop to write
+        self._start_after_id = None
+        self._finish_prompt = None  # open "finish current task?" dialog
+        self._io_queue = None  # update downloads/installs for _io_loop (see _run_io)
+        self._update_cancel = None  # Event that stops the running update download
 
         # Create logs directory if it doesn't exist
-        if not os.path.exists(self.LOGS_DIR):
-            os.makedirs(self.LOGS_DIR)
+        os.makedirs(self.LOGS_DIR, exist_ok=True)
 
         # Migrate old data format if needed
         self.migrate_old_data()
 
         self.load_tasks()
         self.setup_ui()
-        self.start_reminder_timer()
+        self._schedule_reminder()
+
+        # Log files are written by a background thread so disk stalls
+        # (antivirus, synced folders) don't freeze the UI
+        Thread(target=self._writer_loop, daemon=True).start()
+
+        # Catch up on history changes made while minimized (e.g. from a reminder)
+        self.root.bind('<Map>', self._on_map)
 
         # Bind F11 for fullscreen toggle
         self.root.bind('<F11>', lambda e: self.toggle_fullscreen())
@@ -299,7 +437,7 @@ class WorkLogger:  # pylint: disable=too-many-instance-attributes
             bd=0
         )
         self.task_entry.pack(fill=tk.BOTH, padx=12, pady=10)
-        self.task_entry.bind('<Return>', lambda e: self.start_new_task())
+        self.task_entry.bind('<Return>', lambda e: self._debounced_start())
 
         button_frame = tk.Frame(new_task_inner, bg=self.colors['white'])
         button_frame.grid(row=3, column=0, sticky=tk.W)
@@ -394,11 +532,15 @@ class WorkLogger:  # pylint: disable=too-many-instance-attributes
             pady=15,
             bd=0,
             state=tk.DISABLED,
+            # Read-only view: never keep an undo log of the rebuilds
+            undo=False,
+            maxundo=0,
             highlightthickness=1,
             highlightbackground=self.colors['border'],
             highlightcolor=self.colors['primary']
         )
         self.history_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self._configure_history_tags()
 
         # Buttons for task management
         history_btn_frame = tk.Frame(history_inner, bg=self.colors['white'])
@@ -533,53 +675,132 @@ class WorkLogger:  # pylint: disable=too-many-instance-attributes
 
         # If there's a current task, ask to finish it
         if self.current_task and not self.current_task.completed:
-            response = messagebox.askyesno(
-                "Current Task Active",
-                "You have an active task. Do you want to finish it first?"
+            self._prompt_finish_current(
+                on_yes=lambda: self._finalize_new_task(description, True),
+                on_no=lambda: self._finalize_new_task(description, False)
             )
-            if response:
-                self.current_task.complete()
+            return
+
+        self._finalize_new_task(description, False)
+
+    def _prompt_finish_current(self, on_yes, on_no):
+        """
+        Ask whether to finish the current task first.
+        Unlike messagebox.askyesno this doesn't block the event loop, so
+        reminders and saves keep running; on_yes or on_no is called with the
+        answer (closing the dialog counts as no). Neither is called if another
+        task was started while the prompt was open.
+        """
+        # Only one prompt at a time; starting again brings the open one back up
+        if self._finish_prompt is not None:
+            self._finish_prompt.lift()
+            return
+
+        task = self.current_task
+        dialog = tk.Toplevel(self.root)
+        self._finish_prompt = dialog
+        dialog.title("Current Task Active")
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+
+        frame = ttk.Frame(dialog, padding="20")
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Label(
+            frame, text="You have an active task. Do you want to finish it first?"
+        ).pack(pady=(0, 15))
+
+        def answer(callback):
+            self._finish_prompt = None
+            dialog.destroy()
+            # A task started meanwhile (e.g. from a reminder) made this
+            # question stale; answering it mustn't finish that task too
+            if self.current_task is task:
+                callback()
+
+        btn_frame = ttk.Frame(frame)
+        btn_frame.pack()
+
+        ttk.Button(
+            btn_frame, text="Yes", command=lambda: answer(on_yes)
+        ).pack(side=tk.LEFT, padx=5)
+        ttk.Button(
+            btn_frame, text="No", command=lambda: answer(on_no)
+        ).pack(side=tk.LEFT, padx=5)
+
+        # No grab: a reminder popping up meanwhile must stay usable
+        dialog.protocol("WM_DELETE_WINDOW", lambda: answer(on_no))
+
+    def _finalize_new_task(self, description, finish_current):
+        """Start a task with the given description, finishing the current one first if asked."""
+        # The current task may have been finished meanwhile (e.g. from a reminder)
+        if finish_current and self.current_task and not self.current_task.completed:
+            self.current_task.complete()
+            self._mark_dirty(self.current_task)
+            self._history_update_task(self.current_task)
 
         # Create new task
         new_task = Task(description)
-        self.tasks.append(new_task)
+        self._add_task(new_task)
         self.current_task = new_task
 
         # Clear entry
         self.task_entry.delete(0, tk.END)
 
-        # Save and update UI
+        # Save and update only the parts of the UI that changed
         self.save_tasks()
-        self.update_ui()
+        self._refresh_current_task()
+        self._history_add_task(new_task)
+
+    def _debounced_start(self):
+        """
+        Schedule starting a new task from the entry.
+        Enter presses within START_DELAY_MS of each other (e.g. a held key)
+        start a single task.
+        """
+        if self._start_after_id is not None:
+            self.root.after_cancel(self._start_after_id)
+        self._start_after_id = self.root.after(self.START_DELAY_MS, self._run_debounced_start)
+
+    def _run_debounced_start(self):
+        """Start the task scheduled by _debounced_start."""
+        self._start_after_id = None
+        self.start_new_task()
 
     def finish_current_task(self):
         """Finish current task without starting a new one."""
         if self.current_task and not self.current_task.completed:
             self.current_task.complete()
+            self._history_update_task(self.current_task)
+            self.save_tasks(self.current_task)
             self.current_task = None
-            self.save_tasks()
-            self.update_ui()
+            self._refresh_current_task()
             messagebox.showinfo("Task Finished", "Current task has been marked as complete.")
 
     def finish_and_start_new(self):
         """Finish current task and start a new one."""
         if self.current_task and not self.current_task.completed:
             self.current_task.complete()
-            self.save_tasks()
+            self.save_tasks(self.current_task)
+            self._refresh_current_task()
+            self._history_update_task(self.current_task)
 
         self.start_new_task()
 
-    def update_ui(self):  # pylint: disable=too-many-statements
+    def update_ui(self):
         """Update the user interface with current task and history."""
-        # Update current task display
+        self._refresh_current_task()
+        self._refresh_history()
+
+    def _refresh_current_task(self):
+        """Update the current task display and the buttons that depend on it."""
         if self.current_task and not self.current_task.completed:
             self.current_task_label.config(
                 text=self.current_task.description,
                 fg=self.colors['secondary']
             )
-            start_time = datetime.fromisoformat(self.current_task.start_time)
             self.current_task_time.config(
-                text=f"Started: {start_time.strftime('%Y-%m-%d %H:%M')}"
+                text=f"Started: {self.current_task.start_display}"
             )
             self.finish_only_btn.config(state=tk.NORMAL, bg=self.colors['secondary'])
             self.finish_btn.config(state=tk.NORMAL, bg=self.colors['warning'])
@@ -592,11 +813,11 @@ class WorkLogger:  # pylint: disable=too-many-instance-attributes
             self.finish_only_btn.config(state=tk.DISABLED, bg='#cbd5e0')
             self.finish_btn.config(state=tk.DISABLED, bg='#cbd5e0')
 
-        # Update task history
-        self.history_text.config(state=tk.NORMAL)
-        self.history_text.delete(1.0, tk.END)
-
-        # Configure text tags for styling
+    def _configure_history_tags(self):
+        """
+        Configure the styles of the history text tags, once; they outlive
+        the text, so rebuilding the history doesn't need to repeat this.
+        """
         self.history_text.tag_configure(
             "task_name", font=('Segoe UI', 11, 'bold'), foreground=self.colors['text_dark']
         )
@@ -618,103 +839,262 @@ class WorkLogger:  # pylint: disable=too-many-instance-attributes
         self.history_text.tag_configure(
             "entry_bg", background='#ffffff', borderwidth=1, relief=tk.SOLID
         )
+        self.history_text.tag_configure("history_footer", underline=True)
+        # Configured last so it is drawn over the other tags
+        self.history_text.tag_config("highlight",
+                                    background='#e3f2fd',
+                                    borderwidth=2,
+                                    relief=tk.SOLID,
+                                    spacing1=5,
+                                    spacing3=5,
+                                    lmargin1=10,
+                                    lmargin2=10,
+                                    rmargin=10)
+
+    def _refresh_history(self):
+        """Rebuild the whole task history (newest first)."""
+        self.history_text.config(state=tk.NORMAL)
+        self.history_text.delete(1.0, tk.END)
 
-        # Store task line mapping for selection (including line count for each task)
-        self.task_line_map = {}
+        # Each task's lines carry a tag of their own (see _task_entry)
+        for tag in self.task_tags:
+            self.history_text.tag_delete(tag)
+        self.task_tags = {}
+
+        self._history_dirty = False
+
+        # Only the most recent history_size tasks are rendered
+        self.history_first_index = max(0, len(self.tasks) - self.history_size)
 
         if not self.tasks:
             self.history_text.insert(tk.END, "No tasks logged yet.", "time_info")
         else:
-            for i, task in enumerate(reversed(self.tasks), 1):
-                # Store the starting line number for this task
-                line_start_index = self.history_text.index(tk.INSERT)
-                line_start = int(line_start_index.split('.', maxsplit=1)[0])
-                actual_index = len(self.tasks) - i  # Index in self.tasks list
-
-                start = datetime.fromisoformat(task.start_time)
-
-                # Task description with number
-                self.history_text.insert(tk.END, f"{i}. {task.description}\n", "task_name")
-
-                # Time information
-                self.history_text.insert(
-                    tk.END,
-                    f"   Started: {start.strftime('%Y-%m-%d %H:%M')}\n",
-                    "time_info"
+            # Collect every entry's (text, tags) pairs and insert them in one
+            # call, so the widget is updated and laid out once
+            parts = []
+            first = self.history_first_index
+            for actual_index in range(len(self.tasks) - 1, first - 1, -1):
+                # Don't add separator after the last task
+                parts += self._task_entry(
+                    self.tasks[actual_index], actual_index, actual_index > first
                 )
+            parts += self._history_footer()
+            self.history_text.insert(tk.END, *parts)
+
+        self.history_text.config(state=tk.DISABLED)
+
+    def _task_entry(self, task, index, with_separator):
+        """
+        Build the history entry for the task at self.tasks[index], ready for
+        Text.insert. Every segment also carries the task's own tag, so the entry
+        (and the task's index) can be found again for clicks and in-place updates.
+        Returns: (list of alternating text and tags)
+        """
+        tag = f"task_{id(task)}"
+        self.task_tags[tag] = index
+        parts = [
+            # Task description with number
+            f"{index + 1}. {task.description}\n", ("task_name", tag),
+            # Time information
+            f"   Started: {task.start_display}\n", ("time_info", tag)
+        ]
+        if task.completed:
+            parts += [
+                f"   Ended: {task.end_display}\n", ("time_info", tag),
+                f"   Duration: {task.duration_str()}\n", ("duration_info", tag),
+                "   Status: ", ("time_info", tag),
+                "✓ Completed\n", ("completed_status", tag)
+            ]
+        else:
+            parts += [
+                "   Status: ", ("time_info", tag),
+                "⏱ In Progress\n", ("progress_status", tag)
+            ]
+
+        # Add separator line for visual clarity
+        if with_separator:
+            parts += ["\n" + "─" * 60 + "\n\n", ("separator", tag)]
+        else:
+            parts += ["\n", ("separator", tag)]
+        return parts
+
+    def _history_footer(self):
+        """
+        Build the note below the history about older tasks not rendered;
+        clicking it shows more of them (see _show_older_tasks).
+        Returns: (list of alternating text and tags, empty if all tasks are shown)
+        """
+        hidden = self.history_first_index
+        if not hidden:
+            return []
+        noun = "task" if hidden == 1 else "tasks"
+        return [
+            f"… + {hidden} earlier {noun} (click to show more)", ("time_info", "history_footer")
+        ]
+
+    def _history_deferred(self):
+        """
+        Check whether history updates should wait for the main window to be shown.
+        While it is minimized nothing is rendered; _on_map rebuilds it once.
+        """
+        if not self._history_dirty and self.root.state() in ('iconic', 'withdrawn'):
+            self._history_dirty = True
+        return self._history_dirty
+
+    def _on_map(self, event):
+        """Rebuild the history if it changed while the main window was hidden."""
+        if event.widget is self.root and self._history_dirty:
+            self._refresh_history()
+
+    def _history_add_task(self, task):
+        """Show a task just appended to self.tasks at the top of the history."""
+        if self._history_deferred():
+            return
+        if len(self.tasks) == 1:
+            # Replaces the "No tasks logged yet." placeholder
+            self._refresh_history()
+            return
+
+        self.history_text.config(state=tk.NORMAL)
+        self.history_text.insert("1.0", *self._task_entry(task, len(self.tasks) - 1, True))
+
+        if len(self.tasks) - self.history_first_index > self.history_size:
+            # Keep the window size: drop the oldest entry shown...
+            oldest_tag = f"task_{id(self.tasks[self.history_first_index])}"
+            ranges = self.history_text.tag_ranges(oldest_tag)
+            if ranges:
+                self.history_text.delete(ranges[0], ranges[-1])
+            self.history_text.tag_delete(oldest_tag)
+            del self.task_tags[oldest_tag]
+            self.history_first_index += 1
+
+            # ...re-render the new oldest one without its separator and recount
+            self._history_update_task(self.tasks[self.history_first_index])
+            self.history_text.config(state=tk.NORMAL)
+            ranges = self.history_text.tag_ranges("history_footer")
+            if ranges:
+                self.history_text.delete(ranges[0], ranges[-1])
+            self.history_text.insert(tk.END, *self._history_footer())
+
+        self.history_text.config(state=tk.DISABLED)
+
+    def _history_update_task(self, task):
+        """Re-render the history entry of a task that changed, leaving the rest alone."""
+        if self._history_deferred():
+            return
+        tag = f"task_{id(task)}"
+        index = self.task_tags.get(tag)
+        ranges = self.history_text.tag_ranges(tag)
+        if index is None or not ranges:
+            # Not shown (older than the rendered window)
+            return
+
+        self.history_text.config(state=tk.NORMAL)
+        self.history_text.delete(ranges[0], ranges[-1])
+        self.history_text.insert(
+            ranges[0], *self._task_entry(task, index, index > self.history_first_index)
+        )
+        self.history_text.config(state=tk.DISABLED)
+
+    def _history_remove_task(self, task, index):
+        """
+        Take a task just removed from self.tasks[index] out of the history.
+        Only the newer entries (renumbered) and the bottom of the window are
+        re-rendered; the rest of the widget is left alone.
+        """
+        if self._history_deferred():
+            return
+        if not self.tasks:
+            # Shows the "No tasks logged yet." placeholder
+            self._refresh_history()
+            return
+
+        self.history_text.config(state=tk.NORMAL)
+        tag = f"task_{id(task)}"
+        ranges = self.history_text.tag_ranges(tag)
+        if ranges:
+            self.history_text.delete(ranges[0], ranges[-1])
+        self.history_text.tag_delete(tag)
+        self.task_tags.pop(tag, None)
+
+        # Tasks after the removed one moved down a place
+        for other_tag, other_index in self.task_tags.items():
+            if other_index > index:
+                self.task_tags[other_tag] = other_index - 1
+
+        # Keep the window full: bring the newest hidden task in at the bottom
+        rerender_from = index
+        first_index = max(0, len(self.tasks) - self.history_size)
+        if first_index < self.history_first_index:
+            footer = self.history_text.tag_ranges("history_footer")
+            position = footer[0] if footer else tk.END
+            if footer:
+                self.history_text.delete(footer[0], footer[-1])
+            self.history_first_index = first_index
+            self.history_text.insert(
+                position, *self._task_entry(self.tasks[first_index], first_index, False),
+                *self._history_footer()
+            )
+            # The entry above it needs its separator back
+            rerender_from = min(index, first_index + 1)
+
+        # Renumber the newer entries (and fix the separator of a new bottom one)
+        for i in range(rerender_from, len(self.tasks)):
+            self._history_update_task(self.tasks[i])
+        self.history_text.config(state=tk.DISABLED)
 
-                # Calculate the number of lines this task will occupy
-                lines_count = 2  # Task name + Started time
-
-                if task.completed:
-                    end = datetime.fromisoformat(task.end_time)
-                    self.history_text.insert(
-                        tk.END,
-                        f"   Ended: {end.strftime('%Y-%m-%d %H:%M')}\n",
-                        "time_info"
-                    )
-                    self.history_text.insert(
-                        tk.END,
-                        f"   Duration: {task.duration_str()}\n",
-                        "duration_info"
-                    )
-                    self.history_text.insert(tk.END, "   Status: ", "time_info")
-                    self.history_text.insert(tk.END, "✓ Completed\n", "completed_status")
-                    lines_count += 3  # Ended, Duration, Status
-                else:
-                    self.history_text.insert(tk.END, "   Status: ", "time_info")
-                    self.history_text.insert(tk.END, "⏱ In Progress\n", "progress_status")
-                    lines_count += 1  # Status
-
-                # Add separator line for visual clarity
-                if i < len(self.tasks):  # Don't add separator after the last task
-                    self.history_text.insert(tk.END, "\n" + "─" * 60 + "\n\n", "separator")
-                    lines_count += 3  # Blank line + separator + blank line
-                else:
-                    self.history_text.insert(tk.END, "\n", "separator")
-                    lines_count += 1
-
-                # Store the task index and line count for selection
-                self.task_line_map[line_start] = {
-                    'task_index': actual_index,
-                    'line_count': lines_count
-                }
+    def _show_older_tasks(self):
+        """Render HISTORY_WINDOW more of the older tasks below the history."""
+        old_first = self.history_first_index
+        self.history_size += self.HISTORY_WINDOW
+        first = max(0, len(self.tasks) - self.history_size)
+        if first == old_first:
+            return
 
+        self.history_text.config(state=tk.NORMAL)
+        footer = self.history_text.tag_ranges("history_footer")
+        position = footer[0] if footer else tk.END
+        if footer:
+            self.history_text.delete(footer[0], footer[-1])
+        self.history_first_index = first
+
+        parts = []
+        for actual_index in range(old_first - 1, first - 1, -1):
+            parts += self._task_entry(
+                self.tasks[actual_index], actual_index, actual_index > first
+            )
+        self.history_text.insert(position, *parts, *self._history_footer())
+
+        # The previous oldest entry now needs its separator
+        self._history_update_task(self.tasks[old_first])
         self.history_text.config(state=tk.DISABLED)
 
     def on_history_click(self, event):
-        """Handle clicks in history text to select tasks."""
-        # Get the line number that was clicked
+        """Handle clicks in history text to select tasks or show older ones."""
         index = self.history_text.index(f"@{event.x},{event.y}")
-        line_num = int(index.split('.', maxsplit=1)[0])
+        tags = self.history_text.tag_names(index)
+        if "history_footer" in tags:
+            self._show_older_tasks()
+            return
 
-        # Find which task this line belongs to
-        for task_line, task_data in self.task_line_map.items():
-            # Check if click is within task's lines using actual line count
-            if task_line <= line_num < task_line + task_data['line_count']:
-                self.selected_task_index = task_data['task_index']  # pylint: disable=attribute-defined-outside-init
+        # Find which task the clicked character belongs to
+        for tag in tags:
+            task_index = self.task_tags.get(tag)
+            if task_index is not None:
+                self.selected_task_index = task_index  # pylint: disable=attribute-defined-outside-init
                 # Highlight the selection with exact dimensions
-                self.highlight_selected_task(task_line, task_data['line_count'])
+                self.highlight_selected_task(tag, self.tasks[task_index])
                 return
 
-    def highlight_selected_task(self, start_line, line_count):
+    def highlight_selected_task(self, tag, task):
         """Highlight the selected task in the history with exact dimensions."""
         self.history_text.tag_remove("highlight", "1.0", tk.END)
         # Highlight only the task content, excluding the separator
-        # Subtract separator lines if present (3 lines: blank + separator + blank)
-        highlight_lines = line_count - 3 if line_count > 4 else line_count - 1
+        content_lines = 5 if task.completed else 3
+        start = self.history_text.index(f"{tag}.first")
         self.history_text.tag_add(
-            "highlight", f"{start_line}.0", f"{start_line + highlight_lines}.0"
+            "highlight", start, f"{start} +{content_lines} lines"
         )
-        self.history_text.tag_config("highlight",
-                                    background='#e3f2fd',
-                                    borderwidth=2,
-                                    relief=tk.SOLID,
-                                    spacing1=5,
-                                    spacing3=5,
-                                    lmargin1=10,
-                                    lmargin2=10,
-                                    rmargin=10)
 
     def edit_task(self):
         """Edit the selected task."""
@@ -775,14 +1155,17 @@ class WorkLogger:  # pylint: disable=too-many-instance-attributes
                 )
                 return
 
-            # Update task
+            # Update task; a new start date moves it to another day's file
+            old_date = task.start_date
             task.description = new_desc
             task.start_time = start_var.get()
             if task.completed and end_var.get():
                 task.end_time = end_var.get()
+            self._reindex_task(task, old_date)
 
-            self.save_tasks()
-            self.update_ui()
+            self.save_tasks(task)
+            self._refresh_current_task()
+            self._history_update_task(task)
             edit_window.destroy()
             messagebox.showinfo("Success", "Task updated successfully!")
 
@@ -813,50 +1196,182 @@ class WorkLogger:  # pylint: disable=too-many-instance-attributes
                 self.current_task = None
 
             # Remove task from list
-            self.tasks.pop(self.selected_task_index)
+            index = self.selected_task_index
+            self._remove_task(index)
             self.selected_task_index = None  # pylint: disable=attribute-defined-outside-init
 
             self.save_tasks()
-            self.update_ui()
+            self._refresh_current_task()
+            self._history_remove_task(task, index)
             messagebox.showinfo("Success", "Task deleted successfully!")
 
     def get_log_file_path(self, date):
         """Get the log file path for a specific date."""
-        date_str = date.strftime('%Y-%m-%d')
-        return os.path.join(self.LOGS_DIR, f"{date_str}.json")
-
-    def save_tasks(self):
-        """Save tasks to daily JSON files."""
-        # Group tasks by date
-        tasks_by_date = {}
-        for task in self.tasks:
-            task_date = datetime.fromisoformat(task.start_time).date()
-            date_str = task_date.strftime('%Y-%m-%d')
-            if date_str not in tasks_by_date:
-                tasks_by_date[date_str] = []
-            tasks_by_date[date_str].append(task)
-
-        # Save each day's tasks to its own file
-        for date_str, day_tasks in tasks_by_date.items():
-            file_path = os.path.join(self.LOGS_DIR, f"{date_str}.json")
-            data = {
-                'date': date_str,
-                'tasks': [task.to_dict() for task in day_tasks]
-            }
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
-
-        # Save current task reference separately
-        current_task_file = os.path.join(self.LOGS_DIR, 'current_task.json')
-        current_data = {
-            'current_task': (
-                self.current_task.to_dict()
-                if self.current_task and not self.current_task.completed
-                else None
+        return self._day_file_path(date.strftime('%Y-%m-%d'))
+
+    def _day_file_path(self, date_str):
+        """Get the log file path for a date string, joined once per day."""
+        path = self._day_file_paths.get(date_str)
+        if path is None:
+            path = self._day_file_paths[date_str] = os.path.join(
+                self.LOGS_DIR, f"{date_str}.json"
             )
-        }
-        with open(current_task_file, 'w', encoding='utf-8') as f:
-            json.dump(current_data, f, indent=2)
+        return path
+
+    def _add_task(self, task):
+        """Append a new task to self.tasks and the index of its day."""
+        self.tasks.append(task)
+        date_str = task.start_date
+        self._ensure_date_loaded(date_str)  # a new day after midnight
+        self.tasks_by_date.setdefault(date_str, []).append(task)
+        self._dirty_dates.add(date_str)
+
+    def _remove_task(self, index):
+        """
+        Remove the task at self.tasks[index] from the list and its day's index.
+        Returns: (the removed task)
+        """
+        task = self.tasks.pop(index)
+        date_str = task.start_date
+        day_tasks = self.tasks_by_date[date_str]
+        day_tasks.remove(task)
+        if not day_tasks:
+            del self.tasks_by_date[date_str]
+        self._dirty_dates.add(date_str)
+        return task
+
+    def _reindex_task(self, task, old_date):
+        """Move an edited task to the index of its new day if its start date changed."""
+        date_str = task.start_date
+        if date_str == old_date:
+            return
+        day_tasks = self.tasks_by_date[old_date]
+        day_tasks.remove(task)
+        if not day_tasks:
+            del self.tasks_by_date[old_date]
+        # Keep what is already saved for the new day
+        self._ensure_date_loaded(date_str)
+        day_tasks = self.tasks_by_date.setdefault(date_str, [])
+        day_tasks.append(task)
+        day_tasks.sort(key=attrgetter('start_time'))
+        self._dirty_dates.update((old_date, date_str))
+
+    def _ensure_date_loaded(self, date_str):
+        """
+        Read a day's log file into tasks_by_date on first use, so rewriting
+        that day keeps the tasks already saved in it. They aren't added to
+        self.tasks; only today's tasks are shown.
+        """
+        if date_str in self._loaded_dates:
+            return
+        self._loaded_dates.add(date_str)
+
+        file_path = self._day_file_path(date_str)
+        try:
+            with open(file_path, 'rb') as f:
+                data = json.loads(f.read())
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Error loading {date_str}.json: {e}")
+            return
+
+        day_tasks = self.tasks_by_date.setdefault(date_str, [])
+        day_tasks.extend(map(Task.from_dict, data.get('tasks', [])))
+        day_tasks.sort(key=attrgetter('start_time'))
+
+    def _mark_dirty(self, task):
+        """Mark the day of a task as needing its log file rewritten."""
+        self._dirty_dates.add(task.start_date)
+
+    def save_tasks(self, *tasks):
+        """
+        Schedule saving the given (added, changed or deleted) tasks to disk.
+        Only the log files of their days are rewritten, and saves requested
+        within SAVE_DELAY_MS of each other are written once.
+        """
+        for task in tasks:
+            self._mark_dirty(task)
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(self.SAVE_DELAY_MS, self._write_tasks)
+
+    def flush_saves(self):
+        """
+        Write a scheduled save immediately and wait until every queued file
+        is on disk (before the app exits).
+        """
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._write_tasks()
+        self._write_queue.join()
+
+    def _write_tasks(self):
+        """
+        Save the tasks of the days marked dirty to their daily JSON files.
+        The documents are built here and handed to the writer thread.
+        """
+        self._save_after_id = None
+
+        # Save each dirty day's tasks to its own file (a day whose last task was
+        # deleted gets an empty list); the document is assembled from each
+        # task's cached JSON so unchanged tasks aren't serialized again
+        for date_str in list(self._dirty_dates):
+            day_tasks = self.tasks_by_date.get(date_str, ())
+            self._write_if_changed(self._day_file_path(date_str), (
+                f'{{"date":{json.dumps(date_str)},"tasks":['
+                + ','.join(task.to_json() for task in day_tasks)
+                + ']}'
+            ))
+            self._dirty_dates.discard(date_str)
+
+        # Save current task reference separately; the task itself is already
+        # in its day file, so only its start time is stored here
+        current_ref = (
+            f'{{"start_time":{json.dumps(self.current_task.start_time)}}}'
+            if self.current_task and not self.current_task.completed
+            else 'null'
+        )
+        self._write_if_changed(
+            self.CURRENT_TASK_FILE, f'{{"current_task_ref":{current_ref}}}'
+        )
+
+    def _write_if_changed(self, file_path, text):
+        """
+        Queue a log file to be written unless this app last wrote it with
+        exactly this content (e.g. current_task.json when only another task changed).
+        """
+        data = text.encode('utf-8')
+        digest = hashlib.blake2b(data, digest_size=8).digest()
+        if self._written_digests.get(file_path) == digest:
+            return
+        # Recorded before queueing, so a failed write's pop (on the writer
+        # thread) can't run first and be overwritten by this stale digest
+        self._written_digests[file_path] = digest
+        self._write_queue.put((file_path, data))
+
+    def _writer_loop(self):
+        """Write queued log files, in order, on the background writer thread."""
+        while True:
+            file_path, data = self._write_queue.get()
+            try:
+                self._write_file_atomic(file_path, data)
+            except OSError as e:
+                # Forget the digest so the next save of this file retries it
+                self._written_digests.pop(file_path, None)
+                print(f"Error saving {file_path}: {e}")
+            finally:
+                self._write_queue.task_done()
+
+    def _write_file_atomic(self, file_path, data):
+        """
+        Write bytes to a file via a temporary file and os.replace, so a crash
+        mid-write leaves the previous version intact instead of a truncated file.
+        """
+        temp_path = file_path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, file_path)
 
     def migrate_old_data(self):  # pylint: disable=too-many-locals
         """Migrate data from old work_log.json format to new daily files format."""
@@ -868,37 +1383,32 @@ class WorkLogger:  # pylint: disable=too-many-instance-attributes
                 with open(old_data_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
 
-                tasks = [Task.from_dict(task_data) for task_data in data.get('tasks', [])]
+                # The old entries already have the daily files' task format,
+                # so they are regrouped as they are, without building Tasks
+                tasks = data.get('tasks', [])
 
                 if tasks:
-                    # Group tasks by date and save to daily files
+                    # Group tasks by date and save to daily files; the date
+                    # is the YYYY-MM-DD prefix of the ISO start time
                     tasks_by_date = {}
-                    for task in tasks:
-                        task_date = datetime.fromisoformat(task.start_time).date()
-                        date_str = task_date.strftime('%Y-%m-%d')
-                        if date_str not in tasks_by_date:
-                            tasks_by_date[date_str] = []
-                        tasks_by_date[date_str].append(task)
-
-                    # Save to daily files
+                    for task_data in tasks:
+                        tasks_by_date.setdefault(task_data['start_time'][:10], []).append(task_data)
+
+                    # Save to daily files, each as one compact document
+                    # written in a single call
                     for date_str, day_tasks in tasks_by_date.items():
-                        file_path = os.path.join(self.LOGS_DIR, f"{date_str}.json")
-                        file_data = {
-                            'date': date_str,
-                            'tasks': [task.to_dict() for task in day_tasks]
-                        }
-                        with open(file_path, 'w', encoding='utf-8') as f:
-                            json.dump(file_data, f, indent=2)
+                        self._write_file_atomic(self._day_file_path(date_str), JSON_ENCODER.encode(
+                            {'date': date_str, 'tasks': day_tasks}
+                        ).encode('utf-8'))
 
                     # Handle current task
                     current_index = data.get('current_task_index')
                     if current_index is not None and 0 <= current_index < len(tasks):
-                        current_task = tasks[current_index]
-                        if not current_task.completed:
-                            current_task_file = os.path.join(self.LOGS_DIR, 'current_task.json')
-                            current_data = {'current_task': current_task.to_dict()}
-                            with open(current_task_file, 'w', encoding='utf-8') as f:
-                                json.dump(current_data, f, indent=2)
+                        current_data = tasks[current_index]
+                        if not current_data.get('completed', False):
+                            self._write_file_atomic(self.CURRENT_TASK_FILE, JSON_ENCODER.encode(
+                                {'current_task': current_data}
+                            ).encode('utf-8'))
 
                 # Rename old file to backup
                 backup_file = 'work_log.json.backup'
@@ -911,66 +1421,67 @@ class WorkLogger:  # pylint: disable=too-many-instance-attributes
     def load_tasks(self):
         """Load tasks from today's daily JSON file only."""
         self.tasks = []
+        self.tasks_by_date = {}
+
+        # Load only today's log file from the logs directory; other days are
+        # read on demand by _ensure_date_loaded. The files are simply opened
+        # (a missing one raises FileNotFoundError) rather than checked first.
+        today = datetime.now().date().isoformat()
+        self._loaded_dates = {today}
+        today_file = f"{today}.json"
+        try:
+            # One read of the raw bytes and one C-level parse;
+            # Tasks are built straight from the parsed list
+            with open(self._day_file_path(today), 'rb') as f:
+                data = json.loads(f.read())
+            self.tasks.extend(map(Task.from_dict, data.get('tasks', [])))
+        except FileNotFoundError:
+            pass
+        except (OSError, json.JSONDecodeError, KeyError) as e:
+            print(f"Error loading {today_file}: {e}")
+
+        # Sort tasks by start time (the file is normally in order
+        # already, which Timsort handles in a single pass)
+        self.tasks.sort(key=attrgetter('start_time'))
+        for task in self.tasks:
+            self.tasks_by_date.setdefault(task.start_date, []).append(task)
 
-        # Load only today's log file from the logs directory
-        if os.path.exists(self.LOGS_DIR):
-            try:
-                # Get today's date
-                today = datetime.now().date()
-                today_file = f"{today.strftime('%Y-%m-%d')}.json"
-                today_file_path = os.path.join(self.LOGS_DIR, today_file)
-
-                # Load today's tasks if the file exists
-                if os.path.exists(today_file_path):
-                    try:
-                        with open(today_file_path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            tasks = [
-                                Task.from_dict(task_data)
-                                for task_data in data.get('tasks', [])
-                            ]
-                            self.tasks.extend(tasks)
-                    except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
-                        print(f"Error loading {today_file}: {e}")
-
-                # Sort tasks by start time
-                self.tasks.sort(key=lambda t: t.start_time)
-
-                # Load current task reference
-                current_task_file = os.path.join(self.LOGS_DIR, 'current_task.json')
-                if os.path.exists(current_task_file):
-                    with open(current_task_file, 'r', encoding='utf-8') as f:
-                        current_data = json.load(f)
-                        current_task_dict = current_data.get('current_task')
-                        if current_task_dict:
-                            # Find the current task in the loaded tasks
-                            for task in self.tasks:
-                                if (task.start_time == current_task_dict['start_time'] and
-                                    task.description == current_task_dict['description']):
-                                    if not task.completed:
-                                        self.current_task = task
-                                    break
-
-            except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
-                messagebox.showerror("Load Error", f"Error loading tasks: {e}")
-
-    def start_reminder_timer(self):
-        """Start background thread for hourly reminders."""
-        self.stop_reminder.clear()
-        self.reminder_thread = Thread(target=self._reminder_loop, daemon=True)
-        self.reminder_thread.start()
-
-    def _reminder_loop(self):
-        """Background loop that shows reminders at intervals."""
-        while not self.stop_reminder.is_set():
-            # Wait for the interval (checking every second for stop signal)
-            for _ in range(self.reminder_interval):
-                if self.stop_reminder.is_set():
-                    return
-                time.sleep(1)
+        # Load current task reference
+        try:
+            with open(self.CURRENT_TASK_FILE, 'rb') as f:
+                current_data = json.loads(f.read())
+            # Older versions stored the whole task under 'current_task'
+            current_ref = (
+                current_data.get('current_task_ref')
+                or current_data.get('current_task')
+            )
+            if current_ref:
+                # Find the current task in the loaded tasks by its start time
+                by_start = {task.start_time: task for task in self.tasks}
+                task = by_start.get(current_ref['start_time'])
+                if task and not task.completed:
+                    self.current_task = task
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, KeyError) as e:
+            messagebox.showerror("Load Error", f"Error loading tasks: {e}")
+
+    def _schedule_reminder(self):
+        """Schedule the next reminder on the Tk event loop."""
+        self._reminder_after_id = self.root.after(
+            self.reminder_interval * 1000, self._on_reminder_tick
+        )
+
+    def _cancel_reminder(self):
+        """Cancel the pending reminder, if any."""
+        if self._reminder_after_id is not None:
+            self.root.after_cancel(self._reminder_after_id)
+            self._reminder_after_id = None
 
-            # Show reminder
-            self.root.after(0, self.show_reminder)
+    def _on_reminder_tick(self):
+        """Show a reminder and re-arm the timer for the next interval."""
+        self._schedule_reminder()
+        self.show_reminder()
 
     def show_reminder(self):  # pylint: disable=too-many-locals,too-many-statements
         """Show reminder popup to log work."""
@@ -1062,14 +1573,17 @@ class WorkLogger:  # pylint: disable=too-many-instance-attributes
                 # Finish current task if any
                 if self.current_task and not self.current_task.completed:
                     self.current_task.complete()
+                    self._mark_dirty(self.current_task)
+                    self._history_update_task(self.current_task)
 
                 # Create new task
                 new_task = Task(description)
-                self.tasks.append(new_task)
+                self._add_task(new_task)
                 self.current_task = new_task
 
                 self.save_tasks()
-                self.update_ui()
+                self._refresh_current_task()
+                self._history_add_task(new_task)
 
             reminder_window.destroy()
 
@@ -1139,18 +1653,11 @@ class WorkLogger:  # pylint: disable=too-many-instance-attributes
 
         entry.bind('<Return>', lambda e: log_task())
 
-    def _flash_window(self, window, times=3):
-        """Flash window to get user's attention."""
-        original_color = window.cget('bg')
-
-        def flash(count):
-            if count > 0:
-                current_color = window.cget('bg')
-                new_color = 'yellow' if current_color == original_color else original_color
-                window.configure(bg=new_color)
-                window.after(200, lambda: flash(count - 1))
-
-        flash(times * 2)
+    def _flash_window(self, window):
+        """Flash window once and ring the bell to get user's attention."""
+        window.configure(bg='yellow')
+        window.after(400, lambda: window.configure(bg=self.colors['bg']))
+        window.bell()
 
     def update_reminder_interval(self):
         """Update the reminder interval from user input."""
@@ -1162,10 +1669,8 @@ class WorkLogger:  # pylint: disable=too-many-instance-attributes
             self.reminder_interval = minutes * 60
 
             # Restart reminder timer with new interval
-            self.stop_reminder.set()
-            if self.reminder_thread:
-                self.reminder_thread.join(timeout=2)
-            self.start_reminder_timer()
+            self._cancel_reminder()
+            self._schedule_reminder()
 
             messagebox.showinfo(
                 "Interval Updated",
@@ -1193,44 +1698,48 @@ class WorkLogger:  # pylint: disable=too-many-instance-attributes
         status_label = ttk.Label(frame, text="Checking for updates...", font=("Arial", 10))
         status_label.pack(pady=(0, 20))
 
-        progress_bar = ttk.Progressbar(frame, mode='indeterminate', length=300)
-        progress_bar.pack(pady=(0, 20))
-        progress_bar.start()
+        from updater import Updater  # pylint: disable=import-outside-toplevel
+        updater = Updater(VERSION)
+        # Manual check: always ask GitHub rather than trust the cache TTL
+        future = updater.check_for_updates_async(force=True)
+        polls = 0
+
+        def poll_result():
+            """
+            Show the result once the background check has finished. Until
+            then the label's dots cycle every 500 ms; the network is what's
+            slow, so there's no progress bar animation to repaint meanwhile.
+            """
+            nonlocal polls
+            if not future.done():
+                polls += 1
+                if polls % 5 == 0:
+                    dots = "." * (polls // 5 % 3 + 1)
+                    status_label.config(text=f"Checking for updates{dots}")
+                progress_window.after(100, poll_result)
+                return
+
+            progress_window.destroy()
 
-        def check_updates_thread():
-            """Background thread to check for updates."""
             try:
-                updater = Updater(VERSION)
                 (is_available, latest_version,
-                 download_url, release_notes) = updater.check_for_updates()
-
-                def update_ui_with_result():
-                    progress_bar.stop()
-                    progress_window.destroy()
-
-                    if is_available:
-                        # Show update available dialog
-                        self._show_update_dialog(
-                            latest_version, download_url, release_notes, updater
-                        )
-                    else:
-                        messagebox.showinfo(
-                            "No Updates Available",
-                            f"You are running the latest version (v{VERSION})."
-                        )
-
-                progress_window.after(0, update_ui_with_result)
-
+                 download_url, release_notes) = future.result()
             except (RuntimeError, OSError, ValueError) as e:
-                def show_error():
-                    progress_bar.stop()
-                    progress_window.destroy()
-                    messagebox.showerror("Update Check Failed", str(e))
+                messagebox.showerror("Update Check Failed", str(e))
+                return
 
-                progress_window.after(0, show_error)
+            if is_available:
+                # Show update available dialog
+                self._show_update_dialog(
+                    latest_version, download_url, release_notes, updater
+                )
+            else:
+                messagebox.showinfo(
+                    "No Updates Available",
+                    f"You are running the latest version (v{VERSION})."
+                )
 
-        # Start background thread
-        Thread(target=check_updates_thread, daemon=True).start()
+        progress_window.after(100, poll_result)
 
     def _show_update_dialog(self, latest_version, download_url, release_notes, updater):
         """Show dialog with update information and install option."""
@@ -1299,7 +1808,7 @@ class WorkLogger:  # pylint: disable=too-many-instance-attributes
         ).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Later", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
 
-    def _download_and_install_update(self, download_url, updater):
+    def _download_and_install_update(self, download_url, updater):  # pylint: disable=too-many-statements
         """Download and install the update with progress indication."""
         # Create progress window
         progress_window = tk.Toplevel(self.root)
@@ -1320,27 +1829,66 @@ class WorkLogger:  # pylint: disable=too-many-instance-attributes
         )
         progress_bar.pack()
 
-        def update_progress(percent):
-            """Update progress bar."""
+        # Closing the window cancels the download (after the current chunk)
+        cancel = self._update_cancel = Event()
+
+        def cancel_download():
+            cancel.set()
+            progress_window.destroy()
+
+        progress_window.protocol("WM_DELETE_WINDOW", cancel_download)
+
+        last_update = 0.0  # time.monotonic() of the last progress shown
+
+        def show_progress(percent):
+            if cancel.is_set():
+                return
             progress_var.set(percent)
             status_label.config(text=f"Downloading update... {percent}%")
 
+        def update_progress(percent):
+            """
+            Update progress bar (called from the download thread).
+            At most one update per PROGRESS_INTERVAL is passed on to the UI
+            thread, so a fast download doesn't flood the Tk event queue; the
+            final 100% is always shown.
+            """
+            nonlocal last_update
+            now = time.monotonic()
+            if percent < 100 and now - last_update < self.PROGRESS_INTERVAL:
+                return
+            last_update = now
+            progress_window.after(0, show_progress, percent)
+
         def download_and_install_thread():
             """Background thread to download and install update."""
             try:
                 # Download
                 downloaded_file = updater.download_update(
-                    download_url, progress_callback=update_progress
+                    download_url, progress_callback=update_progress, chunk_size=1 << 20,
+                    cancel_event=cancel
                 )
+                if downloaded_file is None or cancel.is_set():
+                    return
+
+                ui_ready = Event()
 
                 def install_phase():
-                    status_label.config(text="Installing update...")
-                    progress_var.set(100)
+                    if not cancel.is_set():
+                        # Too late to cancel once installing starts
+                        progress_window.protocol("WM_DELETE_WINDOW", lambda: None)
+                        status_label.config(text="Installing update...")
+                        progress_var.set(100)
+                        progress_window.update_idletasks()
+                    ui_ready.set()
 
                 progress_window.after(0, install_phase)
 
-                # Wait a moment for UI update
-                time.sleep(0.5)
+                # Let the "Installing" state be drawn before installing starts;
+                # the timeout keeps a busy UI thread from holding up the update
+                ui_ready.wait(timeout=2.0)
+                if cancel.is_set():
+                    return
 
                 # Install
                 success = updater.install_update(downloaded_file)
@@ -1354,27 +1902,27 @@ class WorkLogger:  # pylint: disable=too-many-instance-attributes
                                 "The application will now restart to complete the update."
                             )
                             # The updater script will restart the app
-                            self.root.destroy()
-                            sys.exit(0)
+                            self._exit_after_update()
                         else:
                             messagebox.showinfo(
                                 "Update Complete",
                                 "The application has been updated. Please restart the application."
                             )
-                            self.root.destroy()
-                            sys.exit(0)
+                            self._exit_after_update()
 
                 progress_window.after(0, show_success)
 
             except (RuntimeError, OSError, ValueError) as e:
+                if cancel.is_set():
+                    return
+
                 def show_error():
                     progress_window.destroy()
                     messagebox.showerror("Update Failed", f"Failed to install update: {str(e)}")
 
                 progress_window.after(0, show_error)
 
-        # Start background thread
-        Thread(target=download_and_install_thread, daemon=True).start()
+        self._run_io(download_and_install_thread)
 
     def _install_git_update(self, latest_version, updater):
         """Install update using git pull for Python script mode."""
@@ -1410,8 +1958,7 @@ class WorkLogger:  # pylint: disable=too-many-instance-attributes
                             f"Successfully updated to v{latest_version}.\n\n"
                             "The application will now restart."
                         )
-                        self.root.destroy()
-                        sys.exit(0)
+                        self._exit_after_update()
 
                 progress_window.after(0, show_success)
 
@@ -1424,11 +1971,43 @@ class WorkLogger:  # pylint: disable=too-many-instance-attributes
 
                 progress_window.after(0, show_error)
 
-        # Start background thread
-        Thread(target=git_update_thread, daemon=True).start()
+        self._run_io(git_update_thread)
+
+    def _run_io(self, function):
+        """
+        Run an update download or install on the I/O worker thread, started
+        on first use and reused afterwards instead of a new thread per update.
+        It is a daemon thread, so closing the app never waits for it.
+        """
+        if self._io_queue is None:
+            self._io_queue = Queue()
+            Thread(target=self._io_loop, name='worklogger-io', daemon=True).start()
+        self._io_queue.put(function)
+
+    def _io_loop(self):
+        """Run queued update jobs one at a time on the I/O worker thread."""
+        while True:
+            function = self._io_queue.get()
+            try:
+                function()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # Keep the worker alive for later updates
+                print(f"Error in update worker: {e}")
+
+    def _exit_after_update(self):
+        """
+        Exit once an update is installed: pending saves are written, the
+        windows are torn down once, and the process ends at once instead of
+        unwinding SystemExit through Tk and the interpreter's shutdown.
+        """
+        self.flush_saves()
+        self.root.destroy()
+        sys.stdout.flush()
+        os._exit(0)
 
     def _can_use_git_update(self):
         """Check if git update is available (i.e., in a git repository)."""
+        import subprocess  # pylint: disable=import-outside-toplevel
         try:
             result = subprocess.run(
                 ['git', 'rev-parse', '--git-dir'],
@@ -1464,10 +2043,16 @@ class WorkLogger:  # pylint: disable=too-many-instance-attributes
                 return
             if response:  # Yes
                 self.current_task.complete()
-                self.save_tasks()
+                self.save_tasks(self.current_task)
+
+        # Stop reminder timer and write any pending save
+        self._cancel_reminder()
+        self.flush_saves()
 
-        # Stop reminder thread
-        self.stop_reminder.set()
+        # Stop a running update download (its worker is a daemon thread,
+        # so it is dropped at exit either way)
+        if self._update_cancel is not None:
+            self._update_cancel.set()
 
         # Close application
         self.root.destroy()